@@ -1,4 +1,3 @@
-import webbrowser
 import os
 import time
 import subprocess
@@ -6,13 +5,24 @@ import urllib.parse
 from urllib.parse import urlparse 
 import sys
 from datetime import datetime
-import glob
 import re
-import shutil
-
-# --- ADDED IMPORTS FOR FILE DIALOG ---
-import tkinter as tk
-from tkinter import filedialog
+import string
+import tempfile
+import queue
+import threading
+import atexit
+import contextlib
+from collections import deque
+from itertools import chain, islice
+from abc import ABC, abstractmethod
+import json
+import math
+from datetime import timedelta
+
+# --- LAZY IMPORTS ---
+# tkinter, webbrowser, sqlite3, shutil, gzip, hashlib, zipfile and argparse are imported
+# inside the functions that use them, so the menu (and the first tab) isn't kept waiting on them.
+# Run benchmarks/startup_bench.py to check the cold-start numbers after touching imports.
 # ------------------------------------
 
 # --- CONFIGURATION & FILE MANAGEMENT ---
@@ -28,19 +38,54 @@ ULTIMATE_SEARCHER_DIR = os.path.join(DOCS_PATH, 'UltimateSearcherFiles')
 
 # Sub-directory for individual site files (The correct location for all .txt site files)
 SITES_DATA_DIR = os.path.join(ULTIMATE_SEARCHER_DIR, 'SiteUrls')
+# Optional single-file site database (SQLite, indexed on category, host and brand), used when site_storage is 'sqlite'
+SITES_DB_PATH = os.path.join(ULTIMATE_SEARCHER_DIR, 'ultimate_searcher_sites.db')
 
 # Define the location for the configuration files within the new folder
 CONFIG_FILE_PATH = os.path.join(ULTIMATE_SEARCHER_DIR, 'ultimate_searcher_config.txt')
+# Legacy free-form search log, imported once into the structured log below
 LOG_FILE_PATH = os.path.join(ULTIMATE_SEARCHER_DIR, 'ultimate_searcher_log.txt')
+# Structured search log (SQLite, indexed on timestamp, category and keyword)
+SEARCH_LOG_DB_PATH = os.path.join(ULTIMATE_SEARCHER_DIR, 'ultimate_searcher_log.db')
 # Persistent log for site URL updates
 SITE_UPDATE_LOG_PATH = os.path.join(ULTIMATE_SEARCHER_DIR, 'site_update_history.txt')
 
+# Content-addressed store for incremental backups (objects/ + snapshots/ manifests)
+BACKUP_STORE_DIR = os.path.join(DOWNLOADS_PATH, 'UltimateSearcher_Backups')
+
+# Hidden folder inside ULTIMATE_SEARCHER_DIR holding the point-in-time copy a running backup reads from
+BACKUP_STAGING_DIRNAME = '.backup_staging'
+
+# Files at least this big are hard-linked into the backup snapshot instead of copied
+BACKUP_LINK_THRESHOLD = 64 * 1024
+
+# The backup currently running in the background (see BackupJob)
+CURRENT_BACKUP_JOB = None
+
 # Persistent log for site deletions (RE-ADDED)
 SITE_DELETION_LOG_PATH = os.path.join(ULTIMATE_SEARCHER_DIR, 'site_deletion_history.txt')
 
+# Per-phase timings (JSON Lines), recorded only while metrics are turned on
+METRICS_FILE_PATH = os.path.join(ULTIMATE_SEARCHER_DIR, 'ultimate_searcher_metrics.jsonl')
+
+# Unix domain socket the resident daemon (--daemon) listens on, see searcher_client.py
+DAEMON_SOCKET_PATH = os.path.join(ULTIMATE_SEARCHER_DIR, 'searcher.sock')
+
 # Global variable to store the last updated site information during the current session
 LAST_UPDATED_SITES = []
 
+# Parsed category files keyed by path: {file_path: ((mtime_ns, size), Category)}
+SITES_CACHE = {}
+
+# Held while site file transactions swap files in, and while a backup takes its snapshot
+SITE_WRITE_LOCK = threading.Lock()
+
+# Held while the search log database moves old rows into a rotated segment (startup thread vs. log writer)
+SEARCH_LOG_ROTATION_LOCK = threading.Lock()
+
+# Brand name -> every site line using it: {brand: {SiteEntry: Category}}, sharing the cached objects
+BRAND_INDEX = {}
+
 # Browser definitions (ID: (Name, Path_Dictionary, registration_key))
 # NOTE: You MUST adjust these paths if your installation locations are different.
 BROWSERS = {
@@ -62,48 +107,196 @@ BROWSERS = {
 }
 CURRENT_OS = sys.platform
 
+# Registration keys of browsers whose executables accept several URLs on one command line.
+# Batches for these browsers are opened with a single process instead of one process per tab.
+MULTI_URL_BROWSER_KEYS = {'chrome', 'firefox'}
+
+# Set to False to always open tabs one at a time through the webbrowser module
+BATCH_LAUNCH_ENABLED = True
+
+# webbrowser controllers for the one-tab-at-a-time fallback, registered on first use: {browser_path: controller}
+TAB_BROWSERS = {}
+
 # Default configuration settings
 DEFAULT_CONFIG = {
     'browser_id': None,
-    'logging_enabled': False
+    'logging_enabled': False,
+    'metrics_enabled': False,
+    'site_storage': 'files'
+}
+
+# Where the site lists live: one .txt file per category in SITES_DATA_DIR, or SITES_DB_PATH (K menu)
+SITE_STORAGE_CHOICES = ('files', 'sqlite')
+
+# Timed phases in the order they happen, as shown by the metrics viewer (I)
+METRIC_PHASES = (
+    'config_load',       # Reading the config file at startup
+    'site_load',         # load_sites() before each menu
+    'plan_render',       # Rendering every URL of a search
+    'browser_check',     # Looking for a running browser
+    'browser_spawn',     # Starting the browser on a cold start
+    'browser_warmup',    # Waiting for the cold-started browser to be ready
+    'tab_open',          # Handing one batch of tabs to the browser
+    'interactive_pause', # Waiting for Enter between batches
+    'search_total'       # A whole search, start to last tab
+)
+
+# Groups the records of one run of the script in the metrics file
+METRICS_SESSION = f"{int(time.time())}-{os.getpid()}"
+
+# Write-behind logging: a batch is flushed once this many entries wait, or after this many seconds
+LOG_FLUSH_MAX_ENTRIES = 50
+LOG_FLUSH_INTERVAL = 1.0
+
+# Lines of the old text log copied into the search log database per committed batch
+LEGACY_IMPORT_BATCH = 50000
+
+# Log rotation for the search log and the site update/deletion histories. A log is rotated once it
+# exceeds max_bytes or its oldest entry is older than max_age_days. Rotated segments are kept as
+# <log>.1 (newest) ... <log>.<backup_count> (oldest), gzip-compressed if compress is True.
+LOG_ROTATION = {
+    'max_bytes': 5 * 1024 * 1024,
+    'max_age_days': 180,
+    'backup_count': 5,
+    'compress': True
 }
 
+# Rows shown per page by the viewers when the terminal height can't be detected
+LOG_PAGE_SIZE = 20
+
+# Entries shown by a viewer's tail mode unless the user asks for another amount
+TAIL_DEFAULT = 20
+
+# In-memory configuration and the config file mtime it was read at (see get_config)
+CONFIG_CACHE = {'config': None, 'mtime': None}
+
+# Search term encoders a site line can declare with an `encoding=` option
+URL_ENCODERS = {
+    'quote_plus': urllib.parse.quote_plus, # Default: spaces become '+'
+    'quote': urllib.parse.quote            # Spaces become '%20' (Z-Library and others that break with '+')
+}
+
+# Hosts that historically needed standard quoting. Lines for these hosts that don't declare
+# an encoding keep using 'quote', so existing site files behave exactly as before.
+LEGACY_QUOTE_HOSTS = ('z-library.gs', 'ankergames.net', '1tamilmv')
+
 # --- CUSTOM CATEGORY ORDER ---
 # REMOVED: Categories are now loaded dynamically and sorted alphabetically.
 # -----------------------------
 
 # --- FILE UTILITIES ---
 
+def split_site_host(url):
+    """Returns (scheme, host) for a URL or bare domain; host is lowercase without 'www.', login or port."""
+    parsed_url = urlparse(url)
+    netloc = parsed_url.netloc
+    if not netloc and '://' not in url:
+        netloc = url.split('/')[0].split('?')[0].split('#')[0]
+
+    host = netloc.lower().split('@')[-1].split(':')[0]
+    if host.startswith('www.'):
+        host = host[4:]
+    return (parsed_url.scheme if '://' in url else ''), host
+
+def domain_base_from_host(host):
+    """The core brand of an already normalized host ('bollyflix.fo' -> 'bollyflix')."""
+    parts = host.split('.')
+    if len(parts) >= 2:
+        return parts[-2] or None
+    return parts[0] or None
+
 def get_domain_base(url):
     """Extracts the core site brand name."""
     try:
-        parsed_url = urlparse(url)
-        netloc = parsed_url.netloc
+        return domain_base_from_host(split_site_host(url)[1])
+    except Exception:
+        return None 
 
-        if not netloc:
-            if not url.startswith(('http://', 'https://')):
-                netloc = url.split('/')[0]
-            else:
-                return None 
-            
-        if netloc.startswith('www.'):
-            netloc = netloc[4:]
-            
-        netloc = netloc.split('/')[0].split('?')[0].split(':')[0]
+class SiteEntry:
+    """
+    One site line, parsed once at load time: the URL split around its `{}` placeholder,
+    its encoding policy and its scheme/host/brand. Slotted and with interned host strings,
+    so tens of thousands of entries stay small and nothing re-parses URLs later.
+    """
+    __slots__ = ('raw', 'url', 'scheme', 'host', 'brand', 'parts', 'encoding', 'line_no')
+
+    def __init__(self, raw, url, scheme, host, parts, encoding, line_no):
+        self.raw = raw           # Full line as written in the site file (URL + options)
+        self.url = url           # URL template with the `{}` placeholder
+        self.scheme = sys.intern(scheme)   # 'https', 'http' or '' for a bare domain
+        self.host = sys.intern(host)       # Lowercase host without 'www.' or port, e.g. 'bollyflix.fo'
+        brand = domain_base_from_host(host)
+        self.brand = sys.intern(brand) if brand else None # Core site brand name, used by the URL updater
+        self.parts = parts       # Literal text around the placeholder (a single part if there is none)
+        self.encoding = sys.intern(encoding) # Key into URL_ENCODERS
+        self.line_no = line_no   # 1-based line number in the category file
+
+    def render(self, encoded_terms):
+        """Renders the URL from a {encoding: encoded_keyword} dictionary."""
+        return encoded_terms[self.encoding].join(self.parts)
+
+    def __repr__(self):
+        return f"SiteEntry({self.raw!r}, line {self.line_no})"
+
+class Category:
+    """One category file: its menu name, file name and parsed SiteEntry list."""
+    __slots__ = ('name', 'filename', 'entries')
+
+    def __init__(self, name, filename, entries):
+        self.name = name         # Menu name, e.g. 'Cracked Software'
+        self.filename = filename # File in SITES_DATA_DIR, e.g. 'cracked_software.txt'
+        self.entries = entries   # SiteEntry list in file order
+
+    def __repr__(self):
+        return f"Category({self.name!r}, {len(self.entries)} sites)"
+
+def compile_site_line(line, line_no=0):
+    """
+    Parses one site line (`URL [encoding=quote|quote_plus]`) into a SiteEntry.
+    
+    Raises:
+        ValueError if the placeholder or options are malformed.
+    """
+    tokens = line.split()
+    url = line if len(tokens) == 1 else tokens[0] # Share the line's string when there are no options
+
+    encoding = None
+    for option in tokens[1:]:
+        key, _, value = option.partition('=')
+        if key != 'encoding' or value not in URL_ENCODERS:
+            raise ValueError(f"unknown option '{option}' (expected encoding={'/'.join(URL_ENCODERS)})")
+        encoding = value
+
+    scheme, host = split_site_host(url)
+    if encoding is None:
+        encoding = 'quote' if any(legacy in host for legacy in LEGACY_QUOTE_HOSTS) else 'quote_plus'
+
+    # Split the URL around its placeholder, resolving '{{' / '}}' escapes the same way str.format does
+    parts = []
+    current = ''
+    try:
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(url):
+            current += literal
+            if field_name is None:
+                continue
+            if field_name or format_spec or conversion:
+                raise ValueError(f"unsupported placeholder '{{{field_name}}}', use '{{}}'")
+            parts.append(current)
+            current = ''
+    except ValueError as e:
+        if 'placeholder' in str(e):
+            raise
+        raise ValueError(f"malformed braces ({e})")
+    parts.append(current)
 
-        parts = netloc.split('.')
-        
-        if len(parts) >= 2:
-            base_name = parts[-2]
-        elif len(parts) == 1:
-            base_name = parts[0]
-        else:
-            return None
+    if len(parts) > 2:
+        raise ValueError("more than one '{}' placeholder")
 
-        return base_name.lower()
+    return SiteEntry(line, url, scheme, host, tuple(parts), encoding, line_no)
 
-    except Exception:
-        return None 
+def encode_search_terms(raw_keyword):
+    """Encodes a keyword once per supported encoding, for SiteEntry.render."""
+    return {name: encoder(raw_keyword) for name, encoder in URL_ENCODERS.items()}
 
 def create_initial_directory_setup():
     """Creates the SiteUrls directory and instructs the user on where to place the files."""
@@ -111,9 +304,7 @@ def create_initial_directory_setup():
         print(f"Creating SiteUrls directory: {SITES_DATA_DIR}")
         os.makedirs(SITES_DATA_DIR)
         
-    file_paths = glob.glob(os.path.join(SITES_DATA_DIR, '*.txt'))
-    
-    if not file_paths:
+    if not scan_site_files():
         print("\n--- ⚠️ MANUAL SETUP REQUIRED ⚠️ ---")
         print("The script can no longer create default site lists as all URLs have been removed from the code.")
         print(f"1. Go to the directory: **{SITES_DATA_DIR}**")
@@ -127,53 +318,529 @@ def create_initial_directory_setup():
         print("-----------------------------------")
         sys.exit(0)
 
+def scan_site_files():
+    """
+    Lists the category files in the SiteUrls directory in a single directory pass.
+    
+    Returns:
+        A dictionary {file_path: (mtime_ns, size)}
+    """
+    site_files = {}
+    try:
+        with os.scandir(SITES_DATA_DIR) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or not entry.name.endswith('.txt') or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                site_files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        pass
+    return site_files
+
+def index_site_file(category):
+    """Adds a category's site entries to BRAND_INDEX."""
+    for entry in category.entries:
+        if entry.brand:
+            BRAND_INDEX.setdefault(entry.brand, {})[entry] = category
+
+def unindex_site_file(category):
+    """Removes a category's site entries from BRAND_INDEX."""
+    for entry in category.entries:
+        matches = BRAND_INDEX.get(entry.brand)
+        if matches is None:
+            continue
+        matches.pop(entry, None)
+        if not matches:
+            del BRAND_INDEX[entry.brand]
+
+def brand_entries(brand):
+    """Every (Category, SiteEntry) using a brand, ordered by file and line number."""
+    matches = BRAND_INDEX.get(brand, {})
+    return sorted(((category, entry) for entry, category in matches.items()),
+                  key=lambda match: (match[0].filename, match[1].line_no))
+
+def category_display_name(filename):
+    """Converts a filename (e.g., 'cracked_software.txt') to its Category Name (e.g., 'Cracked Software')."""
+    return os.path.splitext(filename)[0].replace('_', ' ').title()
+
+def read_site_lines(file_path, stamp, conn=None):
+    """
+    Returns the lines of one category: from its text file, or from the site database when
+    the stamp came from scan_sites_db() (conn is an open site database connection, if any).
+    """
+    if stamp[0] != 'db':
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.readlines()
+    if conn is not None:
+        return read_sites_db_lines(conn, os.path.basename(file_path))
+    conn = open_sites_db()
+    try:
+        return read_sites_db_lines(conn, os.path.basename(file_path))
+    finally:
+        conn.close()
+
+def parse_site_file(file_path, stamp, conn=None):
+    """
+    Reads and compiles one category file into SITES_CACHE and BRAND_INDEX.
+    In database mode file_path is the category's would-be path in SITES_DATA_DIR.
+    
+    Returns:
+        True if the file was parsed, False if it could not be read.
+    """
+    filename = os.path.basename(file_path)
+    name = category_display_name(filename)
+
+    previous = SITES_CACHE.pop(file_path, None)
+    if previous:
+        unindex_site_file(previous[1])
+    
+    try:
+        lines = [(line_no, line.strip()) for line_no, line in enumerate(read_site_lines(file_path, stamp, conn), start=1)]
+    except Exception as e:
+        print(f"Warning: Could not read file {filename}. Skipping. Error: {e}")
+        return False
+
+    # Compile every site line up front so bad templates are reported now, not mid-launch
+    entries = []
+    for line_no, line in lines:
+        if not line or line.startswith('#'):
+            continue
+        try:
+            entries.append(compile_site_line(line, line_no))
+        except ValueError as e:
+            print(f"🚨 WARNING: {filename} line {line_no} is malformed ({e}). Skipping: {line}")
+
+    category = Category(name, filename, entries)
+    SITES_CACHE[file_path] = (stamp, category)
+    index_site_file(category)
+    return True
+
+def refresh_site_file(filename, conn=None):
+    """Re-parses a single category file right after the script edited it, keeping the cache and brand index current."""
+    file_path = os.path.join(SITES_DATA_DIR, filename)
+    if conn is not None:
+        stamp = scan_sites_db(conn).get(file_path)
+        if stamp:
+            parse_site_file(file_path, stamp, conn)
+        return
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return
+    parse_site_file(file_path, (stat.st_mtime_ns, stat.st_size))
+
+def fsync_directory(dir_path):
+    """Flushes a directory entry to disk so a rename inside it survives a crash (no-op where unsupported)."""
+    try:
+        dir_fd = os.open(dir_path, os.O_RDONLY)
+    except OSError:
+        return # Windows can't open directories; NTFS journals the rename itself
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+class SiteFileTransaction:
+    """
+    Batches edits to category files and commits them together, crash-safe.
+    
+    Every staged file is written to a temp file next to it, fsynced, and only then renamed over
+    the original, so a crash or Ctrl-C can never leave a truncated category file behind.
+    Leaving the `with` block through an exception discards all staged edits. If a rename fails
+    partway, the files already renamed stay changed and are listed in `committed`.
+    In database mode the same edits become row updates in one SQLite transaction instead.
+    
+    Usage:
+        with SiteFileTransaction() as transaction:
+            lines = transaction.read_lines('movies.txt')
+            transaction.write_lines('movies.txt', lines + ['https://example.com/?s={}\n'])
+    """
+
+    def __init__(self):
+        self.pending = {}   # {filename: [lines]}
+        self.committed = [] # Filenames whose new content is live on disk (or in the database)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.pending.clear()
+        return False
+
+    def read_lines(self, filename):
+        """Returns the file's lines, including edits already staged in this transaction."""
+        if filename in self.pending:
+            return list(self.pending[filename])
+        if sites_db_enabled():
+            return read_site_lines(os.path.join(SITES_DATA_DIR, filename), ('db',))
+        with open(os.path.join(SITES_DATA_DIR, filename), 'r', encoding='utf-8') as f:
+            return f.readlines()
+
+    def write_lines(self, filename, lines):
+        """Stages the full new content of a category file."""
+        self.pending[filename] = list(lines)
+
+    def append_lines(self, filename, new_lines):
+        """Stages lines to be added at the end of a category file."""
+        lines = self.read_lines(filename)
+        if lines and not lines[-1].endswith('\n'):
+            lines[-1] += '\n'
+        self.write_lines(filename, lines + [line if line.endswith('\n') else line + '\n' for line in new_lines])
+
+    def commit(self):
+        """Writes, fsyncs and atomically renames every staged file into place."""
+        if sites_db_enabled():
+            self.commit_to_db()
+            return
+
+        staged = []
+        try:
+            for filename, lines in self.pending.items():
+                # Dot-prefixed .tmp names are ignored by scan_site_files
+                file_path = os.path.join(SITES_DATA_DIR, filename)
+                fd, temp_path = tempfile.mkstemp(prefix=f".{filename}.", suffix='.tmp', dir=SITES_DATA_DIR)
+                staged.append((filename, temp_path, file_path))
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.writelines(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+                # mkstemp creates private files; keep the original file's permissions
+                try:
+                    os.chmod(temp_path, os.stat(file_path).st_mode & 0o7777)
+                except OSError:
+                    pass
+        except BaseException:
+            for _, temp_path, _ in staged:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            raise
+
+        try:
+            with SITE_WRITE_LOCK:
+                for filename, temp_path, file_path in staged:
+                    os.replace(temp_path, file_path)
+                    self.committed.append(filename)
+        finally:
+            # A failed rename leaves the files before it swapped in: drop the other temp files and keep the cache in step
+            for _, temp_path, _ in staged[len(self.committed):]:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            fsync_directory(SITES_DATA_DIR)
+            for filename in self.committed:
+                refresh_site_file(filename)
+            self.pending.clear()
+
+    def commit_to_db(self):
+        """Database mode: stores every staged category in one SQLite transaction, rewriting only changed lines."""
+        conn = open_sites_db()
+        try:
+            with SITE_WRITE_LOCK, conn:
+                for filename, lines in self.pending.items():
+                    write_sites_db_lines(conn, filename, lines)
+            self.committed = list(self.pending)
+            for filename in self.pending:
+                refresh_site_file(filename, conn)
+        finally:
+            conn.close()
+        self.pending.clear()
+
 def load_sites():
     """
     Loads the site dictionary dynamically by reading individual text files 
     in the SiteUrls directory, sorting them alphabetically by filename.
     
+    Each site line is compiled into a SiteEntry. Parsed files are cached by
+    path, mtime and size, so a menu refresh only re-reads category files that
+    were added or changed since the last call. In database mode the categories
+    come from SITES_DB_PATH instead, cached by their last-change stamp.
+    
     Returns:
-        A dictionary {index: (name, filename, urls_list)}
+        A dictionary {index: Category}
     """
-    sites_dict = {}
-    
-    if not os.path.exists(SITES_DATA_DIR) or not glob.glob(os.path.join(SITES_DATA_DIR, '*.txt')):
+    conn = open_sites_db() if sites_db_enabled() else None
+    try:
+        return load_sites_from(conn)
+    finally:
+        if conn is not None:
+            conn.close()
+
+def load_sites_from(conn):
+    """load_sites() body: reads the SiteUrls files, or the site database if conn is open."""
+    site_files = scan_sites_db(conn) if conn is not None else scan_site_files()
+    if not site_files and conn is None:
         create_initial_directory_setup()
-        
-    # Get all actual filenames and sort them alphabetically
-    file_paths = sorted(glob.glob(os.path.join(SITES_DATA_DIR, '*.txt')), key=os.path.basename)
-    
-    # Iterate through the sorted files
-    current_index = 1
-    for file_path in file_paths:
-        filename = os.path.basename(file_path)
-        
-        # Convert filename (e.g., 'cracked_software.txt') to Category Name (e.g., 'Cracked Software')
-        name = os.path.splitext(filename)[0].replace('_', ' ').title()
-        
-        urls = []
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                urls = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
-        except Exception as e:
-            print(f"Warning: Could not read file {filename}. Skipping. Error: {e}")
+        site_files = scan_site_files()
+
+    # Forget files that were deleted since the last load
+    changed = False
+    for file_path in list(SITES_CACHE):
+        if file_path not in site_files:
+            unindex_site_file(SITES_CACHE.pop(file_path)[1])
+            changed = True
+
+    # Re-parse only new or modified files
+    for file_path, stamp in site_files.items():
+        cached = SITES_CACHE.get(file_path)
+        if cached and cached[0] == stamp:
             continue
+        if parse_site_file(file_path, stamp, conn):
+            changed = True
 
-        # sites_dict structure: {ID: (Name, Filename, [URLs])}
-        sites_dict[current_index] = (name, filename, urls)
-        current_index += 1
+    # sites_dict structure: {ID: Category}, IDs follow alphabetical filename order
+    sites_dict = {}
+    cached_paths = sorted(SITES_CACHE, key=os.path.basename)
+    for current_index, file_path in enumerate(cached_paths, start=1):
+        sites_dict[current_index] = SITES_CACHE[file_path][1]
 
-    if sites_dict:
-        print(f"🌐 Loaded {len(sites_dict)} site categories from {SITES_DATA_DIR} (Sorted alphabetically).")
-    else:
+    if not sites_dict:
         print("🚨 WARNING: Site directory is empty or all files failed to load.")
+    elif changed:
+        print(f"🌐 Loaded {len(sites_dict)} site categories from {SITES_DB_PATH if conn is not None else SITES_DATA_DIR} (Sorted alphabetically).")
         
     return sites_dict
 
+# --- SITE DATABASE ---
+
+def sites_db_enabled():
+    """True when the loaded configuration keeps the sites in SITES_DB_PATH (and that database exists)."""
+    config = CONFIG_CACHE['config']
+    return bool(config and config.get('site_storage') == 'sqlite') and os.path.exists(SITES_DB_PATH)
+
+def open_sites_db():
+    """Opens (and if needed creates) the site database."""
+    import sqlite3
+    conn = sqlite3.connect(SITES_DB_PATH, timeout=10)
+    # Every physical line of a category file is one row, so comments and blank lines survive a round trip
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS categories (
+            id INTEGER PRIMARY KEY,
+            filename TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            newline TEXT NOT NULL,
+            trailing_newline INTEGER NOT NULL,
+            changed_ns INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS lines (
+            category_id INTEGER NOT NULL REFERENCES categories (id),
+            line_no INTEGER NOT NULL,
+            raw TEXT NOT NULL,
+            host TEXT,
+            brand TEXT,
+            PRIMARY KEY (category_id, line_no)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_lines_host ON lines (host);
+        CREATE INDEX IF NOT EXISTS idx_lines_brand ON lines (brand);
+    """)
+    return conn
+
+def site_line_keys(raw):
+    """(host, brand) of a site line for the database indexes; (None, None) for blank lines and comments."""
+    line = raw.strip()
+    if not line or line.startswith('#'):
+        return None, None
+    host = split_site_host(line.split()[0])[1]
+    if not host:
+        return None, None
+    return host, domain_base_from_host(host)
+
+def scan_sites_db(conn):
+    """
+    Lists the categories in the site database, the way scan_site_files() lists the SiteUrls files.
+    
+    Returns:
+        A dictionary {file_path: ('db', changed_ns)}, file_path being the category's path in SITES_DATA_DIR.
+    """
+    return {os.path.join(SITES_DATA_DIR, filename): ('db', changed_ns)
+            for filename, changed_ns in conn.execute("SELECT filename, changed_ns FROM categories")}
+
+def read_sites_db_lines(conn, filename):
+    """Returns a category's lines from the site database, with the line endings its file had."""
+    row = conn.execute("SELECT id, newline, trailing_newline FROM categories WHERE filename = ?", (filename,)).fetchone()
+    if row is None:
+        raise FileNotFoundError(f"{filename} is not in {SITES_DB_PATH}")
+    category_id, newline, trailing_newline = row
+    lines = [raw + newline for (raw,) in conn.execute(
+        "SELECT raw FROM lines WHERE category_id = ? ORDER BY line_no", (category_id,))]
+    if lines and not trailing_newline:
+        lines[-1] = lines[-1][:-len(newline)]
+    return lines
+
+def write_sites_db_lines(conn, filename, lines):
+    """
+    Stores the new lines of one category, writing only the rows that changed
+    (so a URL update is a single-row UPDATE). Runs inside the caller's transaction.
+    """
+    row = conn.execute("SELECT id FROM categories WHERE filename = ?", (filename,)).fetchone()
+    if row is None:
+        raise FileNotFoundError(f"{filename} is not in {SITES_DB_PATH}")
+    category_id = row[0]
+
+    stored = dict(conn.execute("SELECT line_no, raw FROM lines WHERE category_id = ?", (category_id,)))
+    new_lines = [line.rstrip('\r\n') for line in lines]
+    for line_no, raw in enumerate(new_lines, start=1):
+        if stored.get(line_no) == raw:
+            continue
+        conn.execute("INSERT OR REPLACE INTO lines (category_id, line_no, raw, host, brand) VALUES (?, ?, ?, ?, ?)",
+                     (category_id, line_no, raw) + site_line_keys(raw))
+    if len(stored) > len(new_lines):
+        conn.execute("DELETE FROM lines WHERE category_id = ? AND line_no > ?", (category_id, len(new_lines)))
+
+    trailing_newline = not lines or lines[-1].endswith('\n')
+    conn.execute("UPDATE categories SET trailing_newline = ?, changed_ns = ? WHERE id = ?",
+                 (trailing_newline, time.time_ns(), category_id))
+
+def split_site_file_content(content):
+    """Splits a category file's text into (raw_lines, newline, trailing_newline) for the site database."""
+    raw_lines = content.split('\n')
+    trailing_newline = raw_lines[-1] == ''
+    if trailing_newline:
+        raw_lines.pop()
+    newline = '\r\n' if raw_lines and raw_lines[0].endswith('\r') else '\n'
+    if newline == '\r\n':
+        raw_lines = [line[:-1] if line.endswith('\r') else line for line in raw_lines]
+    return raw_lines, newline, trailing_newline
+
+def import_site_files_to_db():
+    """
+    Copies every SiteUrls/*.txt file into the site database line for line (comments, blank lines
+    and line endings included), replacing what the database held, then reads each category back.
+    
+    Returns:
+        A tuple (imported_count, mismatched_filenames); a file only mismatches if it mixes line endings.
+    """
+    contents = {}
+    for file_path in sorted(scan_site_files(), key=os.path.basename):
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            contents[os.path.basename(file_path)] = f.read()
+
+    conn = open_sites_db()
+    try:
+        with SITE_WRITE_LOCK, conn:
+            conn.execute("DELETE FROM lines")
+            conn.execute("DELETE FROM categories")
+            for filename, content in contents.items():
+                raw_lines, newline, trailing_newline = split_site_file_content(content)
+                cursor = conn.execute(
+                    "INSERT INTO categories (filename, name, newline, trailing_newline, changed_ns) VALUES (?, ?, ?, ?, ?)",
+                    (filename, category_display_name(filename), newline, trailing_newline, time.time_ns()))
+                conn.executemany("INSERT INTO lines (category_id, line_no, raw, host, brand) VALUES (?, ?, ?, ?, ?)",
+                                 [(cursor.lastrowid, line_no, raw) + site_line_keys(raw)
+                                  for line_no, raw in enumerate(raw_lines, start=1)])
+        mismatched = [filename for filename, content in contents.items()
+                      if ''.join(read_sites_db_lines(conn, filename)) != content]
+    finally:
+        conn.close()
+    return len(contents), mismatched
+
+def export_sites_db_to_files(target_dir):
+    """
+    Writes every category of the site database back to `<target_dir>/<filename>.txt`, byte for byte
+    as it was imported (plus any edits). Each file is fsynced and renamed into place.
+    Files in target_dir that aren't in the database are left alone.
+    
+    Returns:
+        The list of filenames written.
+    """
+    os.makedirs(target_dir, exist_ok=True)
+    written = []
+    conn = open_sites_db()
+    try:
+        for (filename,) in conn.execute("SELECT filename FROM categories ORDER BY filename").fetchall():
+            content = ''.join(read_sites_db_lines(conn, filename))
+            file_path = os.path.join(target_dir, filename)
+            fd, temp_path = tempfile.mkstemp(prefix=f".{filename}.", suffix='.tmp', dir=target_dir)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                try:
+                    os.chmod(temp_path, os.stat(file_path).st_mode & 0o7777)
+                except OSError:
+                    os.chmod(temp_path, 0o644) # New file: mkstemp's private mode would hide it from other users
+                with SITE_WRITE_LOCK:
+                    os.replace(temp_path, file_path)
+            except BaseException:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise
+            written.append(filename)
+    finally:
+        conn.close()
+    fsync_directory(target_dir)
+    return written
+
+def site_storage_menu(config):
+    """Shows where the site lists live and moves them between SiteUrls/*.txt and the site database. (K. Site Storage)"""
+    using_db = config.get('site_storage') == 'sqlite'
+    print("\n--- Site Storage 🗄️ ---")
+    print(f"Sites are read from: **{'the SQLite database' if using_db else 'the text files'}**")
+    print(f"  Text files: {SITES_DATA_DIR}")
+    if os.path.exists(SITES_DB_PATH):
+        try:
+            conn = open_sites_db()
+            try:
+                category_count = conn.execute("SELECT COUNT(*) FROM categories").fetchone()[0]
+                site_count = conn.execute("SELECT COUNT(*) FROM lines WHERE host IS NOT NULL").fetchone()[0]
+            finally:
+                conn.close()
+            print(f"  Database:   {SITES_DB_PATH} ({category_count} categories, {site_count} sites)")
+        except Exception as e:
+            print(f"  Database:   {SITES_DB_PATH} (🚨 unreadable: {e})")
+    else:
+        print("  Database:   not created yet")
+    print("1. Import the text files into the database and use it")
+    print("2. Export the database to the text files and use them")
+    print("0. Back")
+    action = input("Choose a storage option: ").strip()
+
+    if action == '1':
+        if os.path.exists(SITES_DB_PATH) and input("This replaces everything in the database with the text files. Continue? (Y/N): ").strip().upper() != 'Y':
+            print("Import cancelled.")
+            return
+        try:
+            imported, mismatched = import_site_files_to_db()
+        except Exception as e:
+            print(f"🚨 Error importing the site files, storage unchanged: {e}")
+            return
+        for filename in mismatched:
+            print(f"⚠️ {filename} mixes line endings; it will be exported with a single kind.")
+        config['site_storage'] = 'sqlite'
+        save_config(config)
+        print(f"🥳 Imported {imported} categories into **{SITES_DB_PATH}**. Edits now go to the database; your .txt files are left as they were.")
+    elif action == '2':
+        if not os.path.exists(SITES_DB_PATH):
+            print("🚨 There's no site database to export yet.")
+            return
+        if input(f"Overwrite the matching .txt files in {SITES_DATA_DIR} with the database? (Y/N): ").strip().upper() != 'Y':
+            print("Export cancelled.")
+            return
+        try:
+            written = export_sites_db_to_files(SITES_DATA_DIR)
+        except Exception as e:
+            print(f"🚨 Error exporting the site database, storage unchanged: {e}")
+            return
+        config['site_storage'] = 'files'
+        save_config(config)
+        print(f"🥳 Exported {len(written)} categories to **{SITES_DATA_DIR}**. The text files are in charge again.")
+    elif action != '0':
+        print("Invalid input. Please choose 0-2.")
+
 # --- CONFIG & LOGGING FUNCTIONS ---
 
-def load_config():
-    """Loads the stored configuration from the config file."""
+def load_config(announce=True):
+    """Loads the stored configuration from the config file. Pass announce=False to load quietly."""
     config = DEFAULT_CONFIG.copy()
     try:
         with open(CONFIG_FILE_PATH, 'r') as f:
@@ -187,115 +854,787 @@ def load_config():
             if len(lines) > 1:
                 config['logging_enabled'] = lines[1].lower() == 'true'
 
-        if config['browser_id'] is not None:
+            if len(lines) > 2:
+                config['metrics_enabled'] = lines[2].lower() == 'true'
+
+            if len(lines) > 3 and lines[3] in SITE_STORAGE_CHOICES:
+                config['site_storage'] = lines[3]
+
+        if announce and config['browser_id'] is not None:
             browser_name = BROWSERS[config['browser_id']][0]
             print(f"✨ Found saved preference: Using {browser_name} automatically.")
 
     except FileNotFoundError:
-        print("Config file not found. Starting initial setup.")
+        if announce:
+            print("Config file not found. Starting initial setup.")
     except Exception as e:
         print(f"Error loading config file. Using defaults. Error: {e}")
 
     return config
 
+def get_config_mtime():
+    """Returns the config file's modification time, or None if it doesn't exist yet."""
+    try:
+        return os.stat(CONFIG_FILE_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+def get_config(announce=True):
+    """
+    Returns the in-memory configuration, loaded once at startup.
+    The file is only re-read when its mtime changes (e.g. edited by hand while the script runs).
+    """
+    mtime = get_config_mtime()
+    cached = CONFIG_CACHE['config']
+    if cached is None:
+        CONFIG_CACHE['config'] = load_config(announce)
+    elif mtime != CONFIG_CACHE['mtime']:
+        # Refresh in place so callers holding the dict see the new values
+        cached.clear()
+        cached.update(load_config(announce=False))
+    CONFIG_CACHE['mtime'] = mtime
+    return CONFIG_CACHE['config']
+
 def save_config(config_data):
     """Saves the current configuration to the config file."""
     try:
         with open(CONFIG_FILE_PATH, 'w') as f:
             f.write(f"{config_data['browser_id']}\n")
             f.write(f"{config_data['logging_enabled']}\n")
+            f.write(f"{config_data.get('metrics_enabled', False)}\n")
+            f.write(f"{config_data.get('site_storage', 'files')}\n")
+        CONFIG_CACHE['config'] = config_data
+        CONFIG_CACHE['mtime'] = get_config_mtime()
         print(f"✅ Configuration saved!")
     except Exception as e:
         print(f"Warning: Could not save configuration to {CONFIG_FILE_PATH}. Error: {e}")
         
+# --- LOG ROTATION ---
+
+def log_segment_path(base_path, index, suffix=''):
+    """Path of rotated segment number `index` of a log (1 is the newest)."""
+    return f"{base_path}.{index}{suffix}"
+
+def list_log_segments(base_path, suffix=''):
+    """Returns the existing rotated segments of a log, oldest first."""
+    segments = []
+    for index in range(LOG_ROTATION['backup_count'], 0, -1):
+        for candidate in (log_segment_path(base_path, index, suffix + '.gz'), log_segment_path(base_path, index, suffix)):
+            if os.path.exists(candidate):
+                segments.append(candidate)
+                break
+    return segments
+
+def open_log_segment(path, mode='r'):
+    """Opens a log or rotated segment as text, transparently handling gzip-compressed segments."""
+    if path.endswith('.gz'):
+        import gzip
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+def new_log_segment_path(base_path, suffix=''):
+    """
+    Shifts existing segments up by one (dropping those past the retention count) and
+    returns the path the new segment 1 should be written to, or None if no segments are kept.
+    """
+    backup_count = LOG_ROTATION['backup_count']
+    for index in range(backup_count, 0, -1):
+        for extension in (suffix + '.gz', suffix):
+            source = log_segment_path(base_path, index, extension)
+            if not os.path.exists(source):
+                continue
+            if index >= backup_count:
+                os.remove(source)
+            else:
+                os.replace(source, log_segment_path(base_path, index + 1, extension))
+    if backup_count < 1:
+        return None
+    return log_segment_path(base_path, 1, suffix + ('.gz' if LOG_ROTATION['compress'] else ''))
+
+def iter_log_lines(paths):
+    """Streams lines from a list of logs/segments (oldest first) without loading any of them into memory."""
+    for path in paths:
+        with open_log_segment(path) as f:
+            yield from f
+
+def text_log_needs_rotation(log_path):
+    """Checks a text log against the size and age limits (age comes from the timestamp of its first entry)."""
+    try:
+        size = os.path.getsize(log_path)
+    except OSError:
+        return False
+    if size >= LOG_ROTATION['max_bytes']:
+        return True
+    if not size:
+        return False
+
+    with open(log_path, 'r', encoding='utf-8') as f:
+        first_line = f.readline()
+    match = re.match(r'\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\]', first_line)
+    if not match:
+        return False
+    oldest = datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
+    return datetime.now() - oldest > timedelta(days=LOG_ROTATION['max_age_days'])
+
+def rotate_text_log(log_path):
+    """Rotates a text log into segment 1 (compressing it if configured) when it is over its limits."""
+    if not text_log_needs_rotation(log_path):
+        return False
+
+    segment_path = new_log_segment_path(log_path)
+    if segment_path is None:
+        os.remove(log_path)
+    elif segment_path.endswith('.gz'):
+        import gzip
+        with open(log_path, 'rb') as source, gzip.open(segment_path, 'wb') as target:
+            while True:
+                chunk = source.read(1024 * 1024)
+                if not chunk:
+                    break
+                target.write(chunk)
+        os.remove(log_path)
+    else:
+        os.replace(log_path, segment_path)
+    return True
+
+def rotate_search_log(conn):
+    """
+    Moves old rows out of the search log database into one rotated JSON Lines segment: rows older
+    than max_age_days, plus, when the database is over max_bytes, the oldest rows beyond what fits in
+    half of it. However far over the limit the database is, one rotation brings it back under, so a
+    single big jump (like the old text log import) costs one segment rather than the whole history.
+    Serialized, since both the startup rotation thread and the log writer call it.
+    """
+    with SEARCH_LOG_ROTATION_LOCK:
+        cutoff = (datetime.now() - timedelta(days=LOG_ROTATION['max_age_days'])).strftime("%Y-%m-%d %H:%M:%S")
+        oldest = conn.execute("SELECT MIN(timestamp) FROM searches").fetchone()[0]
+        oversized = os.path.getsize(SEARCH_LOG_DB_PATH) >= LOG_ROTATION['max_bytes']
+        if not oversized and (oldest is None or oldest >= cutoff):
+            return False
+
+        # Rows are inserted in time order, so the excess is everything up to the id of the last row that has to go
+        max_id = 0
+        if oversized:
+            total = conn.execute("SELECT COUNT(*) FROM searches").fetchone()[0]
+            keep = int(total * (LOG_ROTATION['max_bytes'] / 2) / os.path.getsize(SEARCH_LOG_DB_PATH))
+            last_moved = conn.execute("SELECT id FROM searches ORDER BY id LIMIT 1 OFFSET ?", (max(total - keep - 1, 0),)).fetchone()
+            max_id = last_moved[0] if last_moved else 0
+
+        where = "WHERE timestamp < ? OR id <= ?"
+        segment_path = new_log_segment_path(SEARCH_LOG_DB_PATH, '.jsonl')
+        if segment_path:
+            with open_log_segment(segment_path, 'w') as f:
+                for timestamp, category, keyword in iter_query(conn, f"SELECT timestamp, category, keyword FROM searches {where} ORDER BY id", (cutoff, max_id)):
+                    f.write(json.dumps({'timestamp': timestamp, 'category': category, 'keyword': keyword}, ensure_ascii=False) + '\n')
+
+        with conn:
+            conn.execute(f"DELETE FROM searches {where}", (cutoff, max_id))
+        if oversized:
+            conn.execute("VACUUM")
+        return True
+
+def rotate_logs():
+    """Imports the old text log if it's still around, then applies the rotation policy to every persistent log (run at startup)."""
+    prepare_search_log()
+    for log_path in (SITE_UPDATE_LOG_PATH, SITE_DELETION_LOG_PATH, METRICS_FILE_PATH):
+        try:
+            rotate_text_log(log_path)
+        except Exception as e:
+            print(f"Warning: Could not rotate {os.path.basename(log_path)}. Error: {e}")
+
+    if os.path.exists(SEARCH_LOG_DB_PATH):
+        # Checking the database means loading sqlite3, so it happens off the path to the menu
+        threading.Thread(target=rotate_search_log_db, name='search-log-rotation').start()
+
+def rotate_search_log_db():
+    """Opens the search log database and applies the rotation policy to it."""
+    try:
+        conn = open_search_log_db()
+        try:
+            rotate_search_log(conn)
+        finally:
+            conn.close()
+    except Exception as e:
+        print(f"Warning: Could not rotate the search log. Error: {e}")
+
+def show_text_log(log_path, title, empty_message, missing_message, error_label):
+    """
+    Streams a text log and its rotated segments (oldest first) through the pager,
+    optionally showing only the latest entries (tail) or entries matching a pattern.
+    """
+    paths = list_log_segments(log_path)
+    if os.path.exists(log_path):
+        paths.append(log_path)
+
+    if not paths:
+        print(missing_message)
+        return
+
+    tail_count, pattern = ask_view_options()
+
+    try:
+        entries = iter_log_entries(iter_log_lines(paths))
+        if pattern:
+            entries = (entry for entry in entries if pattern.search(entry))
+        if tail_count:
+            # Only the last N entries are ever held in memory
+            entries = iter(deque(entries, maxlen=tail_count))
+
+        pager = Pager()
+        shown = 0
+        for entry in entries:
+            if not shown:
+                print(f"\n--- {title} ---")
+            if not pager.print(entry.rstrip('\n')):
+                break
+            shown += 1
+
+        if not shown:
+            print("\n😏 No entries match that pattern." if pattern else empty_message)
+            return
+        print(f"---------------------------------\n{shown} entr(ies) shown.")
+
+    except Exception as e:
+        print(f"Error reading {error_label}: {e}")
+
+class BufferedLogWriter:
+    """
+    Write-behind log writer: entries are queued and written in batches on a background thread,
+    so logging never delays a tab launch. A batch is flushed when LOG_FLUSH_MAX_ENTRIES entries
+    are waiting, LOG_FLUSH_INTERVAL seconds after its first entry, on flush(), and at exit.
+    """
+
+    def __init__(self, name, write_batch):
+        self.name = name                # Shown in warnings
+        self.write_batch = write_batch  # Called on the background thread with a list of entries
+        self.queue = queue.Queue()
+        self.thread = None
+        self.thread_lock = threading.Lock()
+        LOG_WRITERS.append(self)
+
+    def write_many(self, entries):
+        """Queues entries; they are written together in one batch."""
+        if not entries:
+            return
+        with self.thread_lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name=f"{self.name} writer", daemon=True)
+                self.thread.start()
+        self.queue.put(list(entries))
+
+    def write(self, entry):
+        """Queues a single entry."""
+        self.write_many([entry])
+
+    def flush(self, timeout=5.0):
+        """Blocks until everything queued so far has been written."""
+        if self.thread is None or not self.thread.is_alive():
+            return
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait(timeout)
+
+    def _write(self, batch):
+        try:
+            self.write_batch(batch)
+        except Exception as e:
+            print(f"Warning: Failed to write to {self.name}. Error: {e}")
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, threading.Event):
+                if batch:
+                    self._write(batch)
+                batch, deadline = [], None
+                item.set()
+                continue
+
+            if item:
+                batch.extend(item)
+                if deadline is None:
+                    deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+
+            if batch and (len(batch) >= LOG_FLUSH_MAX_ENTRIES or time.monotonic() >= deadline):
+                self._write(batch)
+                batch, deadline = [], None
+
+def flush_all_logs():
+    """Writes out every queued log entry (called at exit and on Ctrl-C); waits as long as that takes, so nothing queued is lost."""
+    for writer in LOG_WRITERS:
+        writer.flush(timeout=None)
+
+def write_site_update_entries(log_texts):
+    """Appends formatted site update entries to the persistent site update log in a single write."""
+    rotate_text_log(SITE_UPDATE_LOG_PATH)
+    with open(SITE_UPDATE_LOG_PATH, 'a', encoding='utf-8') as f:
+        f.write(''.join(log_texts))
+
 def log_site_update(category_name, old_url, new_url):
     """Appends site update details to the persistent site update log file."""
+    log_site_updates([(category_name, old_url, new_url)])
+
+def log_site_updates(entries):
+    """Queues several (category_name, old_url, new_url) updates; they reach the site update log in a single write."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    SITE_UPDATE_LOG_WRITER.write_many([
+        f"[{timestamp}] Category: {category_name}\n  - OLD: {old_url}\n  - NEW: {new_url}\n---\n"
+        for category_name, old_url, new_url in entries
+    ])
+
+def import_legacy_search_log(conn):
+    """
+    Copies entries from the old text log into the search log database, LEGACY_IMPORT_BATCH lines per
+    committed batch. The byte offset reached is saved with every batch, so an interrupted import
+    resumes where it stopped instead of starting over, and no line is ever imported twice.
+    
+    Returns:
+        The number of entries imported by this call (0 if the import already happened).
+    """
+    legacy_line = re.compile(r'^\[(.+?)\] Category: (.*?)\s*\| Search Term: (.*)$')
+    imported = 0
+    while True:
+        with conn:
+            # Take the write lock before reading the offset, so a second thread or process can't import the same lines
+            conn.execute("BEGIN IMMEDIATE")
+            state = dict(conn.execute("SELECT key, value FROM meta WHERE key IN ('legacy_imported', 'legacy_offset')"))
+            if 'legacy_imported' in state:
+                return imported
+
+            offset = int(state.get('legacy_offset', 0))
+            rows = []
+            finished = True
+            if os.path.exists(LOG_FILE_PATH):
+                with open(LOG_FILE_PATH, 'rb') as f:
+                    f.seek(offset)
+                    for line_count, line in enumerate(f, 1):
+                        offset += len(line)
+                        match = legacy_line.match(line.decode('utf-8', errors='replace').rstrip('\r\n'))
+                        if match:
+                            rows.append(match.groups())
+                        if line_count >= LEGACY_IMPORT_BATCH:
+                            finished = False
+                            break
+
+            conn.executemany("INSERT INTO searches (timestamp, category, keyword) VALUES (?, ?, ?)", rows)
+            imported += len(rows)
+            if finished:
+                conn.execute("DELETE FROM meta WHERE key = 'legacy_offset'")
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", ('legacy_imported' if finished else 'legacy_offset', str(offset)))
+        if finished:
+            return imported
+
+def prepare_search_log(announce=True):
+    """
+    Finishes the one-time import of the old text log before anything else writes to the search log.
+    Runs in the foreground at startup (menu, command line and daemon), never on the log writer thread.
+    """
+    if not os.path.exists(LOG_FILE_PATH):
+        return
     try:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] Category: {category_name}\n  - OLD: {old_url}\n  - NEW: {new_url}\n---\n"
-        with open(SITE_UPDATE_LOG_PATH, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
+        conn = open_search_log_db()
+        try:
+            if announce and not conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone():
+                print("📥 Moving your old text log into the search log database (one time only, hang on)...")
+            imported = import_legacy_search_log(conn)
+        finally:
+            conn.close()
+        # Every entry lives in the database now, so the text copy would only fill up backups
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(LOG_FILE_PATH)
+        if announce and imported:
+            print(f"📥 Imported {imported} entries from the old text log into {SEARCH_LOG_DB_PATH} (the text log is gone now).")
     except Exception as e:
-        print(f"Warning: Failed to write to site update log file. Error: {e}")
+        print(f"Warning: Could not import the old text log. Error: {e}")
+
+def open_search_log_db():
+    """Opens (and if needed creates) the structured search log database."""
+    import sqlite3
+    conn = sqlite3.connect(SEARCH_LOG_DB_PATH, timeout=60) # Long enough to wait out another process's import batch
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS searches (
+            id INTEGER PRIMARY KEY,
+            timestamp TEXT NOT NULL,
+            category TEXT NOT NULL,
+            keyword TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_searches_timestamp ON searches (timestamp);
+        CREATE INDEX IF NOT EXISTS idx_searches_category ON searches (category COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS idx_searches_keyword ON searches (keyword COLLATE NOCASE);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    """)
+    return conn
+
+def write_search_log_rows(rows):
+    """Inserts a batch of (timestamp, category, keyword) rows into the search log database."""
+    conn = open_search_log_db()
+    try:
+        with conn:
+            conn.executemany("INSERT INTO searches (timestamp, category, keyword) VALUES (?, ?, ?)", rows)
+        rotate_search_log(conn)
+    finally:
+        conn.close()
 
 def log_search(keyword, category_name):
-    """Appends the search query and category to the log file."""
+    """Queues the search query and category for the structured search log (written in the background)."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    SEARCH_LOG_WRITER.write((timestamp, category_name, keyword))
+
+# Background writers for the persistent logs
+LOG_WRITERS = []
+SEARCH_LOG_WRITER = BufferedLogWriter("search log", write_search_log_rows)
+SITE_UPDATE_LOG_WRITER = BufferedLogWriter("site update log", write_site_update_entries)
+atexit.register(flush_all_logs)
+
+# --- PHASE METRICS ---
+
+def metrics_enabled():
+    """True when the loaded configuration has metrics turned on."""
+    config = CONFIG_CACHE['config']
+    return bool(config and config.get('metrics_enabled'))
+
+def write_metric_records(records):
+    """Appends timing records to the metrics file as JSON Lines, in a single write."""
+    with open(METRICS_FILE_PATH, 'a', encoding='utf-8') as f:
+        f.write(''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records))
+
+METRICS_WRITER = BufferedLogWriter("metrics", write_metric_records)
+
+def record_phase(phase, seconds, **details):
+    """Queues one timing record (no-op while metrics are off). Extra details, e.g. tabs=5, are stored with it."""
+    if not metrics_enabled():
+        return
+    record = {
+        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'session': METRICS_SESSION,
+        'phase': phase,
+        'ms': round(seconds * 1000, 3)
+    }
+    record.update(details)
+    METRICS_WRITER.write(record)
+
+class PhaseTimer:
+    """
+    Times the enclosed block as one phase: `with PhaseTimer('tab_open', tabs=5): ...`
+    Details can be added inside the block through timer.details. Costs two clock reads when metrics are off.
+    """
+
+    def __init__(self, phase, **details):
+        self.phase = phase
+        self.details = details
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        record_phase(self.phase, time.perf_counter() - self.start, **self.details)
+        return False
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, math.ceil(len(sorted_values) * fraction))
+    return sorted_values[rank - 1]
+
+def load_phase_timings():
+    """Reads the metrics file and its rotated segments. Returns {phase: [ms, ...]}."""
+    paths = list_log_segments(METRICS_FILE_PATH)
+    if os.path.exists(METRICS_FILE_PATH):
+        paths.append(METRICS_FILE_PATH)
+
+    timings = {}
+    for line in iter_log_lines(paths):
+        try:
+            record = json.loads(line)
+            timings.setdefault(record['phase'], []).append(float(record['ms']))
+        except (ValueError, KeyError, TypeError):
+            continue # A partly written or hand-edited line
+    return timings
+
+def show_phase_timings():
+    """Prints the number of samples and p50/p95/max per phase."""
+    METRICS_WRITER.flush()
     try:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] Category: {category_name:<30} | Search Term: {keyword}\n"
-        with open(LOG_FILE_PATH, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
+        timings = load_phase_timings()
     except Exception as e:
-        print(f"Warning: Failed to write to log file. Error: {e}")
+        print(f"🚨 Error reading the metrics file: {e}")
+        return
 
-def view_log():
-    """Reads and displays the search log file content."""
-    try:
-        with open(LOG_FILE_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        if not content.strip():
-            print("\n😏 The search log file is clean, baby. No secret sins found.")
+    if not timings:
+        print("No timings recorded yet. Turn metrics on and run a few searches first, darling ⏱️")
+        return
+
+    print(f"\n{'PHASE':<20}{'COUNT':>8}{'P50 MS':>12}{'P95 MS':>12}{'MAX MS':>12}")
+    print("-" * 64)
+    phases = [phase for phase in METRIC_PHASES if phase in timings]
+    phases += sorted(phase for phase in timings if phase not in METRIC_PHASES)
+    for phase in phases:
+        values = sorted(timings[phase])
+        print(f"{phase:<20}{len(values):>8}{percentile(values, 0.50):>12.1f}{percentile(values, 0.95):>12.1f}{values[-1]:>12.1f}")
+
+def metrics_menu(config):
+    """Shows the per-phase timings and turns recording on or off. (I. Timing Metrics)"""
+    state = "ON ⏱️" if config.get('metrics_enabled') else "OFF 👻"
+    print("\n--- Timing Metrics ⏱️ ---")
+    print(f"Recording is **{state}** (file: {METRICS_FILE_PATH})")
+    print("1. Show p50/p95 per phase")
+    print("2. Turn recording ON/OFF")
+    print("3. Clear recorded timings")
+    print("0. Back")
+    action = input("Choose a metrics option: ").strip()
+
+    if action == '1':
+        show_phase_timings()
+    elif action == '2':
+        config['metrics_enabled'] = not config.get('metrics_enabled')
+        save_config(config)
+        state = "ON ⏱️" if config['metrics_enabled'] else "OFF 👻"
+        print(f"\n📢 Timing metrics are now **{state}**!")
+    elif action == '3':
+        if input("Delete all recorded timings? (Y/N): ").strip().upper() != 'Y':
+            print("Clearing cancelled.")
             return
+        METRICS_WRITER.flush()
+        for path in list_log_segments(METRICS_FILE_PATH) + [METRICS_FILE_PATH]:
+            if os.path.exists(path):
+                os.remove(path)
+        print("🔥 Recorded timings cleared.")
+    elif action != '0':
+        print("Invalid input. Please choose 0-3.")
+
+def terminal_page_size():
+    """Number of lines that fit on the terminal, keeping room for the pager prompt."""
+    try:
+        return max(os.get_terminal_size().lines - 2, 5)
+    except OSError:
+        return LOG_PAGE_SIZE
+
+class Pager:
+    """Prints text one terminal page at a time; Enter shows the next page, Q stops."""
+
+    def __init__(self, page_size=None):
+        self.page_size = page_size or terminal_page_size()
+        self.lines_on_page = 0
+
+    def print(self, text):
+        """Prints text (possibly several lines). Returns False once the user chose to stop."""
+        for line in text.split('\n'):
+            if self.lines_on_page >= self.page_size:
+                if input("-- More: Enter for the next page, Q to stop: ").strip().upper() == 'Q':
+                    return False
+                self.lines_on_page = 0
+            print(line)
+            self.lines_on_page += 1
+        return True
+
+def print_paged(rows, format_row, page_size=None):
+    """Prints rows from an iterator one terminal page at a time. Returns how many rows were shown."""
+    pager = Pager(page_size)
+    shown = 0
+    for row in rows:
+        if not pager.print(format_row(row)):
+            break
+        shown += 1
+    return shown
 
-        print("\n--- Secret Search Log 🤫 ---")
-        print(content)
-        print("----------------------------")
+def ask_view_options(allow_tail=True):
+    """
+    Asks how to view a log or file: everything, only the last N entries (tail), or entries matching a pattern.
+    
+    Returns:
+        A tuple (tail_count or None, compiled pattern or None).
+    """
+    prompt = "Show [A]ll, [T]ail (latest entries) or [F]ilter by pattern? (Enter = all): " if allow_tail else "Show [A]ll or [F]ilter by pattern? (Enter = all): "
+    choice = input(prompt).strip().upper()
 
-    except FileNotFoundError:
-        print(f"\n😏 The log file hasn't been created yet. You need to enable logging (L) and run a search first!")
-    except Exception as e:
-        print(f"Error reading log file: {e}")
+    if choice == 'T' and allow_tail:
+        amount = input(f"How many of the latest entries? (Enter for {TAIL_DEFAULT}): ").strip()
+        return (int(amount) if amount.isdigit() and int(amount) > 0 else TAIL_DEFAULT), None
 
-def view_site_update_log():
-    """Reads and displays the persistent site update history log file content."""
-    try:
-        with open(SITE_UPDATE_LOG_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        if not content.strip():
-            print("\n😏 The site update history log is empty.")
+    if choice == 'F':
+        text = input("Pattern (plain text or regex): ").strip()
+        if text:
+            try:
+                return None, re.compile(text, re.IGNORECASE)
+            except re.error:
+                return None, re.compile(re.escape(text), re.IGNORECASE)
+
+    return None, None
+
+def iter_log_entries(lines, max_entry_lines=200):
+    """
+    Groups streamed log lines into entries: a new entry starts at each '[timestamp]' line and ends
+    after a '---' separator. Entries are capped so memory stays flat even for unstructured files.
+    """
+    entry = []
+    for line in lines:
+        if entry and (line.startswith('[') or len(entry) >= max_entry_lines):
+            yield ''.join(entry)
+            entry = []
+        entry.append(line)
+        if line.strip() == '---':
+            yield ''.join(entry)
+            entry = []
+    if entry:
+        yield ''.join(entry)
+
+def iter_query(conn, sql, params=(), batch_size=LOG_PAGE_SIZE):
+    """Streams query results in small batches instead of loading them all."""
+    cursor = conn.execute(sql, params)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
             return
+        yield from rows
+
+def format_search_row(row):
+    """Formats a (timestamp, category, keyword) row like the old text log."""
+    timestamp, category, keyword = row
+    return f"[{timestamp}] Category: {category:<30} | Search Term: {keyword}"
+
+def iter_archived_searches(keep=None):
+    """
+    Streams (timestamp, category, keyword) rows from the rotated search log segments, newest first.
+    Only rows passing `keep` are buffered, and only one segment's worth at a time.
+    """
+    for segment in reversed(list_log_segments(SEARCH_LOG_DB_PATH, '.jsonl')):
+        rows = []
+        for line in iter_log_lines([segment]):
+            entry = json.loads(line)
+            row = (entry['timestamp'], entry['category'], entry['keyword'])
+            if keep is None or keep(row):
+                rows.append(row)
+        yield from reversed(rows)
+
+def count_searches_per_category(conn):
+    """Search counts per category (case-insensitive) across the live table and every archived segment, busiest first."""
+    counts = {}
+    names = {}
+    live = iter_query(conn, "SELECT category, COUNT(*) FROM searches GROUP BY category COLLATE NOCASE")
+    archived = ((json.loads(line)['category'], 1) for line in iter_log_lines(list_log_segments(SEARCH_LOG_DB_PATH, '.jsonl')))
+    for category, count in chain(live, archived):
+        key = category.lower()
+        names.setdefault(key, category)
+        counts[key] = counts.get(key, 0) + count
+    return sorted(((names[key], count) for key, count in counts.items()), key=lambda row: row[1], reverse=True)
 
-        print("\n--- Site Update History Log 📜 ---")
-        print(content)
-        print("---------------------------------")
+def view_log():
+    """Queries the structured search log (live table plus rotated segments): last N, by category, keyword contains, and counts."""
+    SEARCH_LOG_WRITER.flush()
+    if not os.path.exists(SEARCH_LOG_DB_PATH) and not os.path.exists(LOG_FILE_PATH):
+        print(f"\n😏 The log file hasn't been created yet. You need to enable logging (L) and run a search first!")
+        return
 
-    except FileNotFoundError:
-        print(f"\n😏 The site update log hasn't been created yet. You need to run the URL Updater (W) first!")
+    try:
+        conn = open_search_log_db()
     except Exception as e:
-        print(f"Error reading site update log file: {e}")
+        print(f"Error reading log file: {e}")
+        return
 
-def view_site_deletion_log():
-    """Reads and displays the persistent site deletion history log file content. (RE-ADDED)"""
     try:
-        with open(SITE_DELETION_LOG_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        if not content.strip():
-            print("\n😏 The site deletion history log is empty.")
+        total = conn.execute("SELECT COUNT(*) FROM searches").fetchone()[0]
+        if not total and not list_log_segments(SEARCH_LOG_DB_PATH, '.jsonl'):
+            print("\n😏 The search log file is clean, baby. No secret sins found.")
             return
 
-        print("\n--- Site Deletion History Log 🗑️ ---")
-        print(content)
-        print("---------------------------------")
+        archived_segments = len(list_log_segments(SEARCH_LOG_DB_PATH, '.jsonl'))
+        archive_note = f", plus {archived_segments} archived segment(s)" if archived_segments else ""
+        while True:
+            print(f"\n--- Secret Search Log 🤫 ({total} recent searches{archive_note}) ---")
+            print("1. Last N searches")
+            print("2. Searches by category")
+            print("3. Keyword contains...")
+            print("4. Search counts per category")
+            print("5. Browse archived (rotated) searches")
+            print("0. Back")
+            action = input("Choose a view: ").strip()
+
+            columns = "SELECT timestamp, category, keyword FROM searches"
+            if action == '0':
+                break
+            elif action == '1':
+                amount = input(f"How many? (Enter for {LOG_PAGE_SIZE}): ").strip()
+                limit = int(amount) if amount.isdigit() else LOG_PAGE_SIZE
+                live = list(iter_query(conn, f"{columns} ORDER BY timestamp DESC, id DESC LIMIT ?", (limit,)))
+                # Archived rows are all older than the live ones, so they only fill up what's missing
+                rows = chain(live, islice(iter_archived_searches(), limit - len(live)))
+            elif action == '2':
+                category = input("Category name: ").strip()
+                live = iter_query(conn, f"{columns} WHERE category = ? COLLATE NOCASE ORDER BY timestamp DESC, id DESC", (category,))
+                rows = chain(live, iter_archived_searches(lambda row: row[1].lower() == category.lower()))
+            elif action == '3':
+                term = input("Keyword contains: ").strip()
+                pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+                live = iter_query(conn, f"{columns} WHERE keyword LIKE ? ESCAPE '\\' ORDER BY timestamp DESC, id DESC", (pattern,))
+                rows = chain(live, iter_archived_searches(lambda row: term.lower() in row[2].lower()))
+            elif action == '4':
+                shown = print_paged(count_searches_per_category(conn), lambda row: f"{row[0]:<30} | {row[1]} search(es)")
+                print(f"----------------------------\n{shown} categor(ies) shown.")
+                continue
+            elif action == '5':
+                segments = list_log_segments(SEARCH_LOG_DB_PATH, '.jsonl')
+                if not segments:
+                    print("😏 No archived searches yet. Old searches are archived automatically as the log grows.")
+                    continue
+                term = input("Keyword contains (Enter for all): ").strip().lower()
+                archived = (json.loads(line) for line in iter_log_lines(segments))
+                rows = ((entry['timestamp'], entry['category'], entry['keyword']) for entry in archived if term in entry['keyword'].lower())
+            else:
+                print("Invalid input. Please choose 0-5.")
+                continue
+
+            shown = print_paged(rows, format_search_row)
+            print(f"----------------------------\n{shown} search(es) shown.")
 
-    except FileNotFoundError:
-        print(f"\n😏 The site deletion log hasn't been created yet. Use the 'D' option to remove sites first!")
     except Exception as e:
-        print(f"Error reading site deletion log file: {e}")
+        print(f"Error reading log file: {e}")
+    finally:
+        conn.close()
+
+def view_site_update_log():
+    """Streams the persistent site update history log (including rotated segments) to the screen."""
+    SITE_UPDATE_LOG_WRITER.flush()
+    show_text_log(
+        SITE_UPDATE_LOG_PATH,
+        "Site Update History Log 📜",
+        "\n😏 The site update history log is empty.",
+        f"\n😏 The site update log hasn't been created yet. You need to run the URL Updater (W) first!",
+        "site update log file"
+    )
+
+def view_site_deletion_log():
+    """Streams the persistent site deletion history log (including rotated segments) to the screen. (RE-ADDED)"""
+    show_text_log(
+        SITE_DELETION_LOG_PATH,
+        "Site Deletion History Log 🗑️",
+        "\n😏 The site deletion history log is empty.",
+        f"\n😏 The site deletion log hasn't been created yet. Use the 'D' option to remove sites first!",
+        "site deletion log file"
+    )
 
 def clear_log():
-    """Prompts the user for confirmation and deletes the log file."""
+    """Prompts the user for confirmation and deletes the search log (database, rotated segments and any old text log)."""
+    SEARCH_LOG_WRITER.flush()
     try:
-        if not os.path.exists(LOG_FILE_PATH):
+        log_paths = [path for path in (SEARCH_LOG_DB_PATH, LOG_FILE_PATH) if os.path.exists(path)]
+        log_paths += list_log_segments(SEARCH_LOG_DB_PATH, '.jsonl')
+        if not log_paths:
             print(f"\n😏 The log file hasn't been created yet. Nothing to delete!")
             return
 
         while True:
             action = input("\n🚨 ARE YOU SURE you want to delete this log forever? (Y/N): ").strip().upper()
             if action == 'Y':
-                os.remove(LOG_FILE_PATH)
+                with SEARCH_LOG_ROTATION_LOCK:
+                    for path in log_paths:
+                        os.remove(path)
                 print(f"🔥 Log file deleted! What secrets? We don't know any secrets.")
                 break
             elif action == 'N':
@@ -329,35 +1668,47 @@ def review_updated_sites():
     print("----------------------------------------------------------")
 
 def view_sites_file():
-    """Reads and displays the full site file content for all categories, sorted alphabetically. (MODIFIED)"""
-    
-    print("\n--- Current Sites Configuration (SiteUrls Directory) ---")
-    
-    # Get all actual filenames and sort them alphabetically
-    file_paths = sorted(glob.glob(os.path.join(SITES_DATA_DIR, '*.txt')), key=os.path.basename)
-    
-    displayed_files = 0
+    """Streams the site file content for all categories, sorted alphabetically, through the pager. (MODIFIED)"""
     
-    for file_path in file_paths:
-        filename = os.path.basename(file_path)
-        # Convert filename (e.g., 'cracked_software.txt') to Category Name (e.g., 'Cracked Software')
-        name = os.path.splitext(filename)[0].replace('_', ' ').title()
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-            
-            print(f"\n-- FILE: {name} ({filename}) --")
-            if content:
-                print(content)
-            else:
-                print("[File is Empty]")
-            
-            displayed_files += 1
-        except Exception as e:
-            print(f"Error reading {filename}: {e}")
+    _, pattern = ask_view_options(allow_tail=False)
+
+    conn = open_sites_db() if sites_db_enabled() else None
+    try:
+        print(f"\n--- Current Sites Configuration ({'Site Database' if conn is not None else 'SiteUrls Directory'}) ---")
+
+        # Get all actual filenames (or database categories) and sort them alphabetically
+        site_files = scan_sites_db(conn) if conn is not None else scan_site_files()
+        file_paths = sorted(site_files, key=os.path.basename)
+
+        pager = Pager()
+
+        for file_path in file_paths:
+            filename = os.path.basename(file_path)
+            name = category_display_name(filename)
 
-    if displayed_files == 0:
+            try:
+                shown_lines = 0
+                for line in read_site_lines(file_path, site_files[file_path], conn):
+                    line = line.strip()
+                    if not line or (pattern and not pattern.search(line)):
+                        continue
+                    # The header is only printed once the file has something to show
+                    if not shown_lines and not pager.print(f"\n-- FILE: {name} ({filename}) --"):
+                        return
+                    if not pager.print(line):
+                        return
+                    shown_lines += 1
+
+                if not shown_lines and not pattern:
+                    if not pager.print(f"\n-- FILE: {name} ({filename}) --\n[File is Empty]"):
+                        return
+            except Exception as e:
+                print(f"Error reading {filename}: {e}")
+    finally:
+        if conn is not None:
+            conn.close()
+
+    if not file_paths:
         print(f"🚨 No site files found in {SITES_DATA_DIR}. Use the 'S' option again to see setup instructions.")
 
     print("------------------------------------------------------------------")
@@ -370,6 +1721,10 @@ def edit_sites_info():
     print("2. Open the specific category `.txt` file you want to edit with a simple text editor.")
     print("3. Add or remove URLs, one per line.")
     print("4. *IMPORTANT: Always include `{}` where the search term should go.*")
+    print("5. Optional: add ` encoding=quote` after a URL if the site breaks when spaces become '+'.")
+    if sites_db_enabled():
+        print(f"\n⚠️ Right now your sites are read from the database ({SITES_DB_PATH}), not these files.")
+        print("   Use 'K' to export them to the text files before editing by hand, then import again if you like.")
     print("\nGo make it your own, my clever cutie 😉")
     
     # Show the full content when 'S' is selected for context
@@ -378,42 +1733,375 @@ def edit_sites_info():
 
 # --- BACKUP FUNCTION ---
 
+class BackupJob:
+    """A backup running on a background thread, with progress counters the menu can show."""
+
+    def __init__(self, kind, staged_files, staging_dir, worker):
+        self.kind = kind                 # 'ZIP' or 'Incremental'
+        self.staged_files = staged_files # [(relative_path, staged_path, size, mtime_ns)]
+        self.staging_dir = staging_dir
+        self.worker = worker             # Called on the background thread, returns the lines to report
+        self.total_files = len(staged_files)
+        self.total_bytes = sum(size for _, _, size, _ in staged_files)
+        self.files_done = 0
+        self.bytes_done = 0
+        self.started = time.monotonic()
+        self.result = None               # Lines to print once the job has finished
+        self.thread = threading.Thread(target=self.run, name="backup", daemon=True)
+
+    def add_bytes(self, amount):
+        self.bytes_done += amount
+
+    def progress_text(self):
+        """Bytes processed, file count and ETA, e.g. '12/40 files, 3.1/9.8 MB, ETA 4s'."""
+        elapsed = time.monotonic() - self.started
+        if self.bytes_done and self.total_bytes:
+            eta = f"{elapsed * (self.total_bytes - self.bytes_done) / self.bytes_done:.0f}s"
+        else:
+            eta = "estimating..."
+        return (f"{self.files_done}/{self.total_files} files, "
+                f"{self.bytes_done / 1048576:.1f}/{self.total_bytes / 1048576:.1f} MB, ETA {eta}")
+
+    def run(self):
+        try:
+            self.result = self.worker(self)
+        except Exception as e:
+            self.result = [f"🚨 An error occurred during backup: {e}"]
+        finally:
+            import shutil
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+            try:
+                os.rmdir(os.path.dirname(self.staging_dir))
+            except OSError:
+                pass
+
+def iter_file_chunks(file_path, limit, job=None, chunk_size=1024 * 1024):
+    """Yields at most `limit` bytes of a file in chunks, counting them towards the job's progress."""
+    remaining = limit
+    with open(file_path, 'rb') as f:
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            if job:
+                job.add_bytes(len(chunk))
+            yield chunk
+
+def snapshot_backup_sources():
+    """
+    Takes a consistent point-in-time snapshot of UltimateSearcherFiles into a hidden staging folder.
+    
+    Runs while holding SITE_WRITE_LOCK so no site file transaction commits halfway through.
+    Large files are hard-linked (site files are replaced by rename and logs only grow, so the
+    linked content up to the recorded size can't change), small files are copied, and the
+    search log and site databases are copied with SQLite's online backup API.
+    
+    Returns:
+        A tuple (staged_files, staging_dir) with staged_files as [(relative_path, staged_path, size, mtime_ns)].
+    """
+    import shutil
+    import sqlite3
+
+    staging_root = os.path.join(ULTIMATE_SEARCHER_DIR, BACKUP_STAGING_DIRNAME)
+    shutil.rmtree(staging_root, ignore_errors=True) # Leftovers from an interrupted backup
+    staging_dir = os.path.join(staging_root, datetime.now().strftime("%Y%m%d_%H%M%S"))
+    os.makedirs(staging_dir)
+
+    staged_files = []
+    with SITE_WRITE_LOCK:
+        for relative_path, full_path in iter_backup_sources():
+            if relative_path.endswith(('-journal', '-wal', '-shm')):
+                continue # SQLite side files; the database itself is copied through the backup API
+            staged_path = os.path.join(staging_dir, f"{len(staged_files)}_{os.path.basename(full_path)}")
+
+            if full_path in (SEARCH_LOG_DB_PATH, SITES_DB_PATH):
+                source = sqlite3.connect(full_path)
+                target = sqlite3.connect(staged_path)
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+                    source.close()
+                stat = os.stat(full_path)
+                staged_files.append((relative_path, staged_path, os.path.getsize(staged_path), stat.st_mtime_ns))
+                continue
+
+            stat = os.stat(full_path)
+            linked = False
+            if stat.st_size >= BACKUP_LINK_THRESHOLD:
+                try:
+                    os.link(full_path, staged_path)
+                    linked = True
+                except OSError:
+                    pass
+            if not linked:
+                with open(staged_path, 'wb') as target:
+                    for chunk in iter_file_chunks(full_path, stat.st_size):
+                        target.write(chunk)
+            staged_files.append((relative_path, staged_path, stat.st_size, stat.st_mtime_ns))
+
+    return staged_files, staging_dir
+
+def start_backup_job(kind, worker):
+    """Snapshots the files and hands the slow part of the backup to a background thread."""
+    global CURRENT_BACKUP_JOB
+    if CURRENT_BACKUP_JOB and CURRENT_BACKUP_JOB.result is None:
+        print(f"\n⏳ A backup is already running: {CURRENT_BACKUP_JOB.progress_text()}")
+        return
+
+    try:
+        staged_files, staging_dir = snapshot_backup_sources()
+    except FileNotFoundError:
+        print("\n🚨 Backup Failed: The source folder 'UltimateSearcherFiles' could not be found in your Documents.")
+        return
+    except Exception as e:
+        print(f"\n🚨 An error occurred during backup: {e}")
+        return
+
+    CURRENT_BACKUP_JOB = BackupJob(kind, staged_files, staging_dir, worker)
+    CURRENT_BACKUP_JOB.thread.start()
+    print(f"\n💾 {kind} backup of {CURRENT_BACKUP_JOB.total_files} files started in the background.")
+    print("Keep searching and editing, baby; progress shows at the top of the menu 😘")
+
+def report_backup_job():
+    """Shows the running backup's progress, or its result once (called when the menu is drawn)."""
+    global CURRENT_BACKUP_JOB
+    job = CURRENT_BACKUP_JOB
+    if job is None:
+        return
+    if job.result is None:
+        print(f"\n⏳ {job.kind} backup running: {job.progress_text()}")
+        return
+    print()
+    for line in job.result:
+        print(line)
+    CURRENT_BACKUP_JOB = None
+
+def wait_for_backup_job():
+    """Lets a running backup finish before the script exits."""
+    job = CURRENT_BACKUP_JOB
+    if job and job.result is None:
+        print(f"⏳ Waiting for the running backup to finish ({job.progress_text()})...")
+        job.thread.join()
+        report_backup_job()
+
+def write_zip_backup(job):
+    """Background worker: writes the staged files into a timestamped ZIP in the Downloads folder."""
+    # Ensure Downloads directory exists (usually it does, but good practice)
+    if not os.path.exists(DOWNLOADS_PATH):
+        os.makedirs(DOWNLOADS_PATH)
+
+    # Create a timestamped file name
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S") # Get current time
+    archive_path = os.path.join(DOWNLOADS_PATH, f"UltimateSearcher_Backup_{timestamp}.zip")
+    source_dir_name = os.path.basename(ULTIMATE_SEARCHER_DIR)
+
+    import zipfile
+
+    # Entries live under 'UltimateSearcherFiles/' inside the archive, like the old make_archive output
+    with zipfile.ZipFile(archive_path + '.tmp', 'w', zipfile.ZIP_DEFLATED) as archive:
+        for relative_path, staged_path, size, mtime_ns in job.staged_files:
+            info = zipfile.ZipInfo(f"{source_dir_name}/{relative_path}", datetime.fromtimestamp(mtime_ns / 1e9).timetuple()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with archive.open(info, 'w') as target:
+                for chunk in iter_file_chunks(staged_path, size, job):
+                    target.write(chunk)
+            job.files_done += 1
+    os.replace(archive_path + '.tmp', archive_path)
+
+    return [
+        "-" * 50,
+        "🎉 **BACKUP SUCCESSFUL** 🎉",
+        f"File: **{os.path.basename(archive_path)}**",
+        f"Saved to: **{DOWNLOADS_PATH}**",
+        "-" * 50
+    ]
+
 def create_backup():
-    """Compresses the UltimateSearcherFiles directory into a zip file in the Downloads folder."""
+    """Compresses the UltimateSearcherFiles directory into a zip file in the Downloads folder (in the background)."""
+    start_backup_job('ZIP', write_zip_backup)
+
+def hash_file(file_path, limit, job=None):
+    """Returns the SHA-256 hex digest of the first `limit` bytes of a file, read in chunks."""
+    import hashlib
+    digest = hashlib.sha256()
+    for chunk in iter_file_chunks(file_path, limit, job):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+def backup_object_path(content_hash):
+    """Where the compressed content with this hash lives in the backup store."""
+    return os.path.join(BACKUP_STORE_DIR, 'objects', content_hash[:2], content_hash + '.gz')
+
+def list_backup_snapshots():
+    """Returns the snapshot IDs in the backup store, oldest first."""
+    snapshots_dir = os.path.join(BACKUP_STORE_DIR, 'snapshots')
     try:
-        source_dir_name = os.path.basename(ULTIMATE_SEARCHER_DIR)
-        
-        # Ensure Downloads directory exists (usually it does, but good practice)
-        if not os.path.exists(DOWNLOADS_PATH):
-            os.makedirs(DOWNLOADS_PATH)
+        return sorted(os.path.splitext(name)[0] for name in os.listdir(snapshots_dir) if name.endswith('.json'))
+    except FileNotFoundError:
+        return []
+
+def load_backup_manifest(snapshot_id):
+    """Reads a snapshot manifest from the backup store."""
+    with open(os.path.join(BACKUP_STORE_DIR, 'snapshots', snapshot_id + '.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def iter_backup_sources():
+    """Yields (relative_path, full_path) for every file in UltimateSearcherFiles, skipping temp/hidden files."""
+    for root, dirs, files in os.walk(ULTIMATE_SEARCHER_DIR):
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        for name in files:
+            if name.startswith('.'):
+                continue
+            full_path = os.path.join(root, name)
+            if not os.path.isfile(full_path):
+                continue # e.g. the daemon's socket, which can't be read like a file
+            yield os.path.relpath(full_path, ULTIMATE_SEARCHER_DIR).replace(os.sep, '/'), full_path
+
+def store_backup_object(file_path, size, content_hash):
+    """Compresses a file into the object store unless identical content is already there. Returns bytes written."""
+    object_path = backup_object_path(content_hash)
+    if os.path.exists(object_path):
+        return 0
+
+    import gzip
+
+    os.makedirs(os.path.dirname(object_path), exist_ok=True)
+    temp_path = object_path + '.tmp'
+    with gzip.open(temp_path, 'wb') as target:
+        for chunk in iter_file_chunks(file_path, size):
+            target.write(chunk)
+    os.replace(temp_path, object_path)
+    return os.path.getsize(object_path)
+
+def write_incremental_backup(job):
+    """
+    Background worker: stores an incremental, deduplicated snapshot of the staged files.
+    
+    Files whose size and mtime match the previous snapshot are not even re-read; changed files
+    are hashed and only content that isn't in the store yet is compressed and written. The
+    manifest lists every file with its hash and links back to the previous snapshot.
+    """
+    snapshots = list_backup_snapshots()
+    parent_id = snapshots[-1] if snapshots else None
+    parent_files = load_backup_manifest(parent_id)['files'] if parent_id else {}
+
+    snapshot_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    while snapshot_id in snapshots:
+        snapshot_id += '_1'
+
+    files = {}
+    changed_files = 0
+    stored_bytes = 0
+    for relative_path, staged_path, size, mtime_ns in job.staged_files:
+        previous = parent_files.get(relative_path)
+        if previous and previous['size'] == size and previous['mtime_ns'] == mtime_ns:
+            content_hash = previous['sha256']
+            job.add_bytes(size)
+        else:
+            content_hash = hash_file(staged_path, size, job)
+            changed_files += 1
+            stored_bytes += store_backup_object(staged_path, size, content_hash)
+        files[relative_path] = {'sha256': content_hash, 'size': size, 'mtime_ns': mtime_ns}
+        job.files_done += 1
+
+    manifest = {
+        'id': snapshot_id,
+        'parent': parent_id,
+        'created': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'files': files
+    }
+    snapshots_dir = os.path.join(BACKUP_STORE_DIR, 'snapshots')
+    os.makedirs(snapshots_dir, exist_ok=True)
+    manifest_path = os.path.join(snapshots_dir, snapshot_id + '.json')
+    with open(manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(manifest_path + '.tmp', manifest_path)
+
+    return [
+        "-" * 50,
+        "🎉 **INCREMENTAL BACKUP SUCCESSFUL** 🎉",
+        f"Snapshot: **{snapshot_id}** ({len(files)} files, {changed_files} changed since {parent_id or 'the beginning'})",
+        f"New data stored: {stored_bytes / 1024:.1f} KB",
+        f"Saved to: **{BACKUP_STORE_DIR}**",
+        "-" * 50
+    ]
+
+def create_incremental_backup():
+    """Creates an incremental, deduplicated snapshot of UltimateSearcherFiles (in the background)."""
+    start_backup_job('Incremental', write_incremental_backup)
+
+def restore_backup_snapshot():
+    """Rebuilds a chosen snapshot into a new folder in Downloads (the live folder is never overwritten)."""
+    snapshots = list_backup_snapshots()
+    if not snapshots:
+        print("\n😏 No incremental snapshots yet. Create one first!")
+        return
 
-        # Create a timestamped file name
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S") # Get current time
-        backup_filename_base = f"UltimateSearcher_Backup_{timestamp}"
-        
-        # 1. base_name: output path (excluding .zip)
-        output_base_path = os.path.join(DOWNLOADS_PATH, backup_filename_base)
-        
-        # 2. format: 'zip'
-        # 3. root_dir: The directory that contains the folder we want to zip (Documents).
-        # 4. base_dir: The folder name inside root_dir ('UltimateSearcherFiles').
-        archive_path = shutil.make_archive(
-            base_name=output_base_path,
-            format='zip',
-            root_dir=DOCS_PATH, 
-            base_dir=source_dir_name 
-        )
+    print("\n--- Backup Snapshots 💾 ---")
+    for number, snapshot_id in enumerate(snapshots, start=1):
+        print(f"{number}. {snapshot_id}")
+    choice = input("Which snapshot should I restore? (number, Enter to cancel): ").strip()
+    if not choice.isdigit() or not 1 <= int(choice) <= len(snapshots):
+        print("Restore cancelled.")
+        return
+
+    snapshot_id = snapshots[int(choice) - 1]
+    target_dir = os.path.join(DOWNLOADS_PATH, f"UltimateSearcher_Restore_{snapshot_id}", os.path.basename(ULTIMATE_SEARCHER_DIR))
+    if os.path.exists(target_dir):
+        print(f"🚨 {target_dir} already exists. Move it away first. Restore cancelled.")
+        return
+
+    import gzip
+    import hashlib
+
+    try:
+        manifest = load_backup_manifest(snapshot_id)
+        damaged = []
+        for relative_path, info in manifest['files'].items():
+            target_path = os.path.join(target_dir, *relative_path.split('/'))
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            digest = hashlib.sha256()
+            with gzip.open(backup_object_path(info['sha256']), 'rb') as source, open(target_path, 'wb') as target:
+                while True:
+                    chunk = source.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    target.write(chunk)
+            os.utime(target_path, ns=(info['mtime_ns'], info['mtime_ns']))
+            if digest.hexdigest() != info['sha256']:
+                damaged.append(relative_path)
 
         print("-" * 50)
-        print("🎉 **BACKUP SUCCESSFUL** 🎉")
-        print(f"File: **{os.path.basename(archive_path)}**")
-        print(f"Saved to: **{DOWNLOADS_PATH}**")
+        print(f"🎉 **SNAPSHOT {snapshot_id} RESTORED** 🎉 ({len(manifest['files'])} files)")
+        print(f"Restored to: **{target_dir}**")
+        print("Copy it over your UltimateSearcherFiles folder (with the script closed) to roll back.")
+        for relative_path in damaged:
+            print(f"🚨 WARNING: {relative_path} does not match its recorded checksum.")
         print("-" * 50)
 
-    except FileNotFoundError:
-        print("\n🚨 Backup Failed: The source folder 'UltimateSearcherFiles' could not be found in your Documents.")
     except Exception as e:
-        print(f"\n🚨 An error occurred during backup: {e}")
+        print(f"\n🚨 An error occurred during restore: {e}")
+
+def backup_menu():
+    """Lets the user choose between a full ZIP backup, an incremental snapshot, or a restore."""
+    print("\n--- Backup UltimateSearcher Files 💾 ---")
+    print("1. Full ZIP backup (to Downloads)")
+    print("2. Incremental backup (only changed files)")
+    print("3. Restore a snapshot")
+    print("0. Back")
+    action = input("Choose a backup option: ").strip()
+
+    if action == '1':
+        create_backup()
+    elif action == '2':
+        create_incremental_backup()
+    elif action == '3':
+        restore_backup_snapshot()
+    elif action != '0':
+        print("Invalid input. Please choose 0-3.")
         
 
 # --- MODIFIED LOGIC FUNCTIONS ---
@@ -427,7 +2115,7 @@ def add_new_site(sites_data):
     print("\nSelect a Category to add the site to:")
     category_ids = sorted(sites_data.keys())
     for key in category_ids:
-        print(f"{key}. {sites_data[key][0]}")
+        print(f"{key}. {sites_data[key].name}")
     
     if not sites_data:
         print("🚨 No categories loaded. Please add site files manually to the SiteUrls directory first.")
@@ -448,8 +2136,8 @@ def add_new_site(sites_data):
         except ValueError:
             print("Invalid input. Please enter a number.")
             
-    category_name = sites_data[category_id][0]
-    category_filename = sites_data[category_id][1]
+    category_name = sites_data[category_id].name
+    category_filename = sites_data[category_id].filename
     
     # 2. Get New URL (Modified prompt)
     print(f"\nAdding to Category: {category_name}")
@@ -480,6 +2168,12 @@ def add_new_site(sites_data):
         print("🚨 Error: Could not determine where to place the search term. Please manually edit the URL in the sites file or try again with '{}'. Site not added.")
         return
 
+    try:
+        compile_site_line(final_url)
+    except ValueError as e:
+        print(f"🚨 Error: The URL template is malformed ({e}). Site not added.")
+        return
+
     # 4. Confirmation and Save
     print("\nConfirm New Site:")
     print(f"CATEGORY: {category_name}")
@@ -488,10 +2182,9 @@ def add_new_site(sites_data):
 
     if confirm == 'Y':
         # Write the URL to the end of the specific file
-        file_path = os.path.join(SITES_DATA_DIR, category_filename)
         try:
-            with open(file_path, 'a', encoding='utf-8') as f:
-                f.write(final_url + '\n')
+            with SiteFileTransaction() as transaction:
+                transaction.append_lines(category_filename, [final_url])
             
             print(f"🥳 Successfully added new site to **{category_filename}**!")
         except Exception as e:
@@ -500,6 +2193,68 @@ def add_new_site(sites_data):
         print("Adding site cancelled by user.")
 
 
+def ask_for_text_file(title):
+    """Opens a file selection dialog for a .txt file and returns its path ('' if cancelled)."""
+    # Tk is only loaded once a dialog is actually needed
+    import tkinter as tk
+    from tkinter import filedialog
+
+    # Initialize Tkinter root window and suppress the main window
+    root = tk.Tk()
+    root.withdraw() 
+    
+    # Open the file selection dialog
+    file_path = filedialog.askopenfilename(
+        defaultextension=".txt",
+        filetypes=[("Text files", "*.txt")],
+        title=title
+    )
+    root.destroy()
+    return file_path
+
+def normalize_batch_url(new_url):
+    """
+    Validates one line of a batch-add file and auto-appends the search placeholder if it's missing.
+    No I/O, so it can be reused (and benchmarked) outside the menu.
+    
+    Returns:
+        A tuple (final_url, message): final_url is None if the line was skipped,
+        message explains a correction or a skip (None if the URL was fine as is).
+    """
+    if not new_url.startswith(('http://', 'https://')):
+        return None, f"🚨 Skipping invalid URL (must start with http/s): {new_url}"
+        
+    final_url = new_url
+    message = None
+    
+    # Auto-append the search placeholder if it's missing
+    if '{}' not in new_url:
+        
+        parsed_url = urlparse(new_url)
+        
+        if parsed_url.query:
+             # If query exists, append search parameter
+             final_url = new_url + "&s={}"
+        else:
+             # If no query, append a standard search query to the path
+             clean_base = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}".rstrip('/')
+             final_url = clean_base + "/?s={}"
+             
+        final_url = final_url.replace('//?', '/?')
+
+        # Only report the correction if it changed
+        if final_url != new_url:
+            message = f"🤖 Corrected: {new_url} -> **{final_url}**"
+    
+    if '{}' not in final_url:
+        return None, f"🚨 Skipping URL (could not determine search spot, and placeholder missing): {new_url}"
+
+    try:
+        compile_site_line(final_url)
+    except ValueError as e:
+        return None, f"🚨 Skipping malformed URL template ({e}): {final_url}"
+    return final_url, message
+
 def add_batch_sites_from_file(sites_data):
     """
     Prompts the user to select a text file containing new site URLs, 
@@ -521,7 +2276,7 @@ def add_batch_sites_from_file(sites_data):
     print("\nSelect a Category to add the sites to:")
     category_ids = sorted(sites_data.keys())
     for key in category_ids:
-        print(f"{key}. {sites_data[key][0]}")
+        print(f"{key}. {sites_data[key].name}")
     
     if not sites_data:
         print("🚨 No categories loaded. Please add site files manually to the SiteUrls directory first.")
@@ -542,23 +2297,14 @@ def add_batch_sites_from_file(sites_data):
         except ValueError:
             print("Invalid input. Please enter a number.")
             
-    category_name = sites_data[category_id][0]
-    category_filename = sites_data[category_id][1]
+    category_name = sites_data[category_id].name
+    category_filename = sites_data[category_id].filename
     
     # 2. Select File and Read URLs
     print(f"\nCategory Selected: {category_name}")
     print("Waiting for file selection dialog...")
     
-    # Initialize Tkinter root window and suppress the main window
-    root = tk.Tk()
-    root.withdraw() 
-    
-    # Open the file selection dialog
-    file_path = filedialog.askopenfilename(
-        defaultextension=".txt",
-        filetypes=[("Text files", "*.txt")],
-        title="Select file with new site URLs (one per line)"
-    )
+    file_path = ask_for_text_file("Select file with new site URLs (one per line)")
 
     if not file_path:
         print("File selection cancelled. Site batch addition aborted.")
@@ -583,35 +2329,11 @@ def add_batch_sites_from_file(sites_data):
     final_urls_to_add = []
     
     for new_url in new_urls_raw:
-        if not new_url.startswith(('http://', 'https://')):
-            print(f"🚨 Skipping invalid URL (must start with http/s): {new_url}")
-            continue
-            
-        final_url = new_url
-        
-        # Auto-append the search placeholder if it's missing
-        if '{}' not in new_url:
-            
-            parsed_url = urlparse(new_url)
-            
-            if parsed_url.query:
-                 # If query exists, append search parameter
-                 final_url = new_url + "&s={}"
-            else:
-                 # If no query, append a standard search query to the path
-                 clean_base = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}".rstrip('/')
-                 final_url = clean_base + "/?s={}"
-                 
-            final_url = final_url.replace('//?', '/?')
-
-            # Only print the correction if it changed
-            if final_url != new_url:
-                print(f"🤖 Corrected: {new_url} -> **{final_url}**")
-        
-        if '{}' in final_url:
-             final_urls_to_add.append(final_url)
-        else:
-            print(f"🚨 Skipping URL (could not determine search spot, and placeholder missing): {new_url}")
+        final_url, message = normalize_batch_url(new_url)
+        if message:
+            print(message)
+        if final_url:
+            final_urls_to_add.append(final_url)
 
     if not final_urls_to_add:
         print("No valid URLs were finalized for addition. Operation cancelled.")
@@ -626,11 +2348,10 @@ def add_batch_sites_from_file(sites_data):
 
     if confirm == 'Y':
         # Write the URLs to the end of the specific file, adding a newline for separation
-        file_path = os.path.join(SITES_DATA_DIR, category_filename)
         try:
-            # Add a leading newline before the batch content
-            with open(file_path, 'a', encoding='utf-8') as f:
-                f.write('\n' + '\n'.join(final_urls_to_add) + '\n')
+            # Add a blank line before the batch content
+            with SiteFileTransaction() as transaction:
+                transaction.append_lines(category_filename, [''] + final_urls_to_add)
             
             print(f"🥳 Successfully added {len(final_urls_to_add)} new sites to **{category_filename}**!")
         except Exception as e:
@@ -639,10 +2360,157 @@ def add_batch_sites_from_file(sites_data):
         print("Adding site batch cancelled by user.")
 
 
+def build_updated_url(old_url, new_scheme_netloc):
+    """Moves an existing site URL onto a new scheme/netloc, keeping its path, query and search placeholder."""
+    parsed_old_url = urlparse(old_url)
+    
+    # Start building the new URL with the new scheme/netloc and the old path
+    new_url = new_scheme_netloc + parsed_old_url.path
+    
+    # Check for the search placeholder '{}' in the old URL
+    if '{}' in old_url:
+        # If the old URL had a placeholder, ensure the new one gets the necessary query parameters from the old one
+        
+        # 1. If the old URL had a query component, transfer it
+        if parsed_old_url.query:
+            # Use regex to find the placeholder and the preceding search parameter name
+            match_param = re.search(r'([a-zA-Z0-9_-]+)=\{\}', parsed_old_url.query)
+            if match_param:
+                # Reconstruct the query string using the correct parameter and the placeholder
+                query_parts = []
+                for part in parsed_old_url.query.split('&'):
+                    if part.endswith('={}'):
+                        query_parts.append(part)
+                    else:
+                        # Keep other query parameters (if any)
+                        query_parts.append(part)
+                
+                new_url += '?' + '&'.join(query_parts)
+            else:
+                # Fallback if no clean param= found, just append the full query/placeholder to be safe
+                new_url += '?' + parsed_old_url.query
+            
+            # Simple check to ensure placeholder is present, if the above logic missed it
+            if '{}' not in new_url:
+                new_url += '&s={}' # Common fallback search parameter
+                
+        # 2. Check for path-based placeholder (e.g., /search/{})
+        elif '{}' in parsed_old_url.path:
+            # Re-add the placeholder to the new URL's path if it was in the old path
+            new_url = new_url.replace(parsed_old_url.path, parsed_old_url.path) # Path is already preserved, so this is mostly defensive
+            
+        # 3. Final safety net: If placeholder is still missing, add the simple search query
+        if '{}' not in new_url:
+            new_url = new_url.rstrip('/') + '/?s={}'
+            
+    else:
+        # If the old URL did not have a placeholder, assume it's a domain-only site (e.g. for Direct Downloads/Torrents) or a link that doesn't need a search term.
+        # We only replace the scheme and netloc, keeping the path/query/fragment of the old URL intact.
+        new_url = new_scheme_netloc + parsed_old_url.path
+        if parsed_old_url.query:
+            new_url += '?' + parsed_old_url.query
+        if parsed_old_url.fragment:
+            new_url += '#' + parsed_old_url.fragment
+
+    # Final check: Ensure the placeholder is still in the new URL IF it was in the old URL
+    if '{}' in old_url and '{}' not in new_url:
+        # This is a critical fallback for complex cases the logic above might have missed
+        print("🚨 CRITICAL WARNING: The placeholder '{}' is missing from the calculated NEW URL.")
+        # Re-apply the most common search query format as a final fix
+        if '?' in new_url:
+            new_url += '&s={}'
+        else:
+            new_url += '/?s={}'
+        print(f"🤖 Final Auto-corrected New URL to: **{new_url}**")
+
+    return new_url
+
+def find_brand_matches(base_name, new_scheme_netloc):
+    """
+    Looks up every site line using a brand in BRAND_INDEX and works out its replacement URL.
+    
+    Returns:
+        A list of update dictionaries, ordered by file and line number.
+    """
+    updates = []
+    for category, entry in brand_entries(base_name):
+        new_url = build_updated_url(entry.url, new_scheme_netloc)
+        updates.append({
+            'category_name': category.name,
+            'category_filename': category.filename,
+            'line_no': entry.line_no,
+            'old_url': entry.url,
+            'old_line': entry.raw,
+            # Keep any per-line options (e.g. encoding=quote) after the new URL
+            'new_line': new_url + entry.raw[len(entry.url):],
+            'new_url': new_url
+        })
+    return updates
+
+def apply_site_updates(updates):
+    """
+    Rewrites each affected category file exactly once, replacing the lines listed in updates.
+    All files are committed in a single crash-safe SiteFileTransaction.
+    
+    Returns:
+        The list of updates that were actually written (on a partial failure, those in the files already saved).
+    """
+    updates_by_file = {}
+    for update in updates:
+        updates_by_file.setdefault(update['category_filename'], []).append(update)
+
+    applied = []
+    transaction = SiteFileTransaction()
+    try:
+        # One transaction for the whole operation: all files are swapped in only once every one is staged
+        with transaction:
+            for category_filename, file_updates in updates_by_file.items():
+                lines = transaction.read_lines(category_filename)
+                file_changed = False
+
+                for update in file_updates:
+                    index = update['line_no'] - 1
+                    # The file may have been edited by hand since it was indexed, so fall back to a content match
+                    if not (0 <= index < len(lines) and lines[index].strip() == update['old_line']):
+                        index = next((i for i, line in enumerate(lines) if line.strip() == update['old_line']), None)
+                    if index is None:
+                        print(f"🚨 Error: Could not find {update['old_url']} in {category_filename} during rewrite. Skipped.")
+                        continue
+                    lines[index] = update['new_line'] + '\n'
+                    applied.append(update)
+                    file_changed = True
+
+                if file_changed:
+                    transaction.write_lines(category_filename, lines)
+
+    except Exception as e:
+        if not transaction.committed:
+            print(f"🚨 Error modifying site files, no file was changed: {e}")
+            return []
+        # Renames aren't atomic across files, so report (and let the caller log) the ones that went through
+        print(f"🚨 Error modifying site files: {e}")
+        print(f"⚠️ These file(s) were already saved and keep their changes: {', '.join(transaction.committed)}")
+        return [update for update in applied if update['category_filename'] in transaction.committed]
+
+    return applied
+
+
+def record_site_updates(applied):
+    """Logs applied updates in one append and remembers them for the current-session review (R)."""
+    log_site_updates([(update['category_name'], update['old_url'], update['new_url']) for update in applied])
+
+    global LAST_UPDATED_SITES
+    for update in applied:
+        LAST_UPDATED_SITES.append({
+            'category': update['category_name'],
+            'old_url': update['old_url'],
+            'new_url': update['new_url']
+        })
+
 def auto_update_site_url(sites_data):
     """
-    Automatically detects the old URL based on the domain's base name and updates it with the new URL 
-    by modifying the specific text file.
+    Automatically detects the old URLs based on the domain's base name (using the brand index)
+    and updates every match, in every category, with the new URL.
     """
     print("\n--- Automatic Site URL Updater 🤖 ---")
     
@@ -650,169 +2518,380 @@ def auto_update_site_url(sites_data):
         print("🚨 No categories loaded. Please add site files manually to the SiteUrls directory first.")
         return
 
-    new_url_raw = input("Enter the **NEW** working site URL (e.g., https://bollyflix.miami/): ").strip()
+    new_url_raw = input("Enter the **NEW** working site URL (e.g., https://bollyflix.miami/): ").strip()
+
+    if not new_url_raw:
+        print("Input cannot be empty. Update cancelled.")
+        return
+
+    base_name = get_domain_base(new_url_raw)
+
+    if not base_name:
+        print("🚨 Could not determine the site's brand name from the URL. Please check the format.")
+        return
+
+    print(f"🤖 Searching for sites matching brand name: **{base_name}**...")
+    
+    parsed_new_url = urlparse(new_url_raw)
+    new_scheme_netloc = f"{parsed_new_url.scheme}://{parsed_new_url.netloc}"
+
+    # 1. Resolve every matching URL across all categories in one index lookup
+    matches = find_brand_matches(base_name, new_scheme_netloc)
+
+    if not matches:
+        print(f"😔 No existing sites found containing the brand name **{base_name}**. Update cancelled.")
+        return
+
+    # Check if the new URL is identical to the old one after processing
+    updates = [match for match in matches if match['new_url'].strip() != match['old_url'].strip()]
+    if not updates:
+        print("⚠️ The old and new URLs appear identical after processing. Update skipped.")
+        return
+
+    # 2. Confirmation and Save (File modification)
+    print(f"\nConfirm Replacement ({len(updates)} match(es)):")
+    for update in updates:
+        print(f"CATEGORY: {update['category_name']} ({update['category_filename']}, line {update['line_no']})")
+        print(f"  OLD: {update['old_url']}")
+        print(f"  NEW: {update['new_url']}")
+    confirm = input("Proceed with update? (Y/N): ").strip().upper()
+
+    if confirm != 'Y':
+        print("Update cancelled by user.")
+        return
+
+    applied = apply_site_updates(updates)
+    record_site_updates(applied)
+
+    if applied:
+        updated_files = sorted({update['category_filename'] for update in applied})
+        print(f"🥳 Successfully updated {len(applied)} **{base_name}** site(s) in **{', '.join(updated_files)}**!")
+
+
+def normalize_host(url_or_domain):
+    """Reduces a URL or bare domain to its lowercase host without 'www.' or port (e.g. 'bollyflix.fo')."""
+    return split_site_host(url_or_domain.strip())[1]
+
+def parse_url_mappings(file_path):
+    """
+    Reads an old -> new domain mapping file. Each line holds an old and a new domain or URL,
+    separated by '->' or whitespace. Empty lines and '#' comments are ignored.
+    
+    Returns:
+        A list of (line_no, old_host, new_value) tuples.
+    """
+    mappings = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            fields = line.replace('->', ' ').split()
+            if len(fields) != 2 or not normalize_host(fields[0]):
+                print(f"🚨 Skipping mapping line {line_no} (expected 'old -> new'): {line}")
+                continue
+            mappings.append((line_no, normalize_host(fields[0]), fields[1]))
+    return mappings
+
+def plan_bulk_updates(mappings):
+    """
+    Resolves each old -> new mapping against BRAND_INDEX into line updates.
+    A site line is only changed by the first mapping that matches its host.
+    
+    Returns:
+        A tuple (updates, unmatched_mapping_lines).
+    """
+    updates = []
+    claimed = set()
+    unmatched = []
+    for line_no, old_host, new_value in mappings:
+        parsed_new = urlparse(new_value if '://' in new_value else '//' + new_value)
+        matched = False
+        for category, entry in brand_entries(domain_base_from_host(old_host)):
+            if entry.host != old_host:
+                continue
+            matched = True
+            if entry in claimed:
+                print(f"⚠️ Mapping line {line_no}: {category.filename} line {entry.line_no} is already remapped by an earlier line. Skipped.")
+                continue
+
+            # Bare domains keep the scheme of the URL they replace
+            scheme = parsed_new.scheme or entry.scheme or 'https'
+            new_url = build_updated_url(entry.url, f"{scheme}://{parsed_new.netloc}")
+            if new_url.strip() == entry.url.strip():
+                continue
+
+            claimed.add(entry)
+            updates.append({
+                'category_name': category.name,
+                'category_filename': category.filename,
+                'line_no': entry.line_no,
+                'old_url': entry.url,
+                'old_line': entry.raw,
+                'new_line': new_url + entry.raw[len(entry.url):],
+                'new_url': new_url
+            })
+        if not matched:
+            unmatched.append(line_no)
+    return updates, unmatched
+
+def bulk_update_site_urls(sites_data):
+    """
+    Applies a whole file of old -> new domain mappings in one pass: every affected category file
+    is rewritten exactly once and all changes are logged in a single append.
+    """
+    print("\n--- Bulk Site URL Updater 🗂️ ---")
+    
+    if not sites_data:
+        print("🚨 No categories loaded. Please add site files manually to the SiteUrls directory first.")
+        return
+
+    print("\n📄 **GUIDE: Mapping File Format**")
+    print("One mapping per line, old domain/URL first, new domain/URL second:")
+    print("   *Example*: `bollyflix.fo -> https://bollyflix.miami`")
+    print("Lines starting with '#' are ignored.")
+    print("Waiting for file selection dialog...")
+
+    file_path = ask_for_text_file("Select file with old -> new domain mappings")
+    if not file_path:
+        print("File selection cancelled. Bulk update aborted.")
+        return
+
+    try:
+        mappings = parse_url_mappings(file_path)
+    except Exception as e:
+        print(f"🚨 Error reading file {file_path}: {e}")
+        return
+
+    if not mappings:
+        print("The selected file contains no valid mappings. Operation cancelled.")
+        return
 
-    if not new_url_raw:
-        print("Input cannot be empty. Update cancelled.")
+    updates, unmatched = plan_bulk_updates(mappings)
+
+    for line_no in unmatched:
+        print(f"😔 Mapping line {line_no}: no existing site uses that domain.")
+
+    if not updates:
+        print("Nothing to update. Operation cancelled.")
         return
 
-    base_name = get_domain_base(new_url_raw)
+    # Confirmation and Save, grouped per file
+    print(f"\n--- Ready to Update ({len(updates)} site(s) from {len(mappings)} mapping(s)) ---")
+    for update in sorted(updates, key=lambda u: (u['category_filename'], u['line_no'])):
+        print(f"{update['category_filename']}:{update['line_no']}  {update['old_url']}  ->  {update['new_url']}")
+    confirm = input("Proceed with all updates? (Y/N): ").strip().upper()
 
-    if not base_name:
-        print("🚨 Could not determine the site's brand name from the URL. Please check the format.")
+    if confirm != 'Y':
+        print("Bulk update cancelled by user.")
         return
 
-    print(f"🤖 Searching for sites matching brand name: **{base_name}**...")
-    
-    parsed_new_url = urlparse(new_url_raw)
-    new_scheme_netloc = f"{parsed_new_url.scheme}://{parsed_new_url.netloc}"
+    applied = apply_site_updates(updates)
+    record_site_updates(applied)
+
+    if applied:
+        updated_files = {update['category_filename'] for update in applied}
+        print(f"🥳 Successfully updated {len(applied)} site(s) across {len(updated_files)} file(s)!")
+
+
+# --- BROWSER READINESS ---
+
+# Process table used to detect a running browser (only present on Linux)
+PROC_DIR = '/proc'
+
+# Longest time to wait for a freshly started browser before opening tabs anyway
+BROWSER_READY_TIMEOUT = 2.0
+BROWSER_READY_POLL_INTERVAL = 0.1
+
+# Fixed warm-up used when the process table can't be read (Windows/macOS)
+BROWSER_WARMUP_FALLBACK = 2.0
+
+# Adaptive tab pacing (see TabPacer). Before each batch the pacer compares the system load, free memory
+# and the browser's memory against the limits below: under pressure the batch size halves and the
+# per-tab delay doubles, with plenty of headroom the batch grows by one and the delay shrinks.
+# Without /proc (Windows/macOS) the start values are used as a fixed pace.
+PACING = {
+    'enabled': True,
+    'min_batch': 2,
+    'start_batch': 5,
+    'max_batch': 15,
+    'min_delay': 0.1,               # Seconds between tabs (and between batches when not pausing)
+    'start_delay': 0.5,
+    'max_delay': 2.0,
+    'max_load_per_cpu': 1.0,        # 1-minute load average per CPU core
+    'min_available_mb': 1024,       # MemAvailable
+    'max_browser_rss_mb': 4096      # Resident memory of all browser processes together
+}
 
-    found_match = None
+def find_browser_pids(browser_path):
+    """
+    Scans /proc for processes running the configured browser executable.
     
-    # 1. Search all categories (files) for a matching URL
-    for category_id, (category_name, category_filename, urls) in sites_data.items():
-        for i, old_url in enumerate(urls):
-            old_base_name = get_domain_base(old_url)
-            
-            if old_base_name == base_name:
-                
-                parsed_old_url = urlparse(old_url)
-                
-                # Start building the new URL with the new scheme/netloc and the old path
-                new_url = new_scheme_netloc + parsed_old_url.path
-                
-                # Check for the search placeholder '{}' in the old URL
-                if '{}' in old_url:
-                    # If the old URL had a placeholder, ensure the new one gets the necessary query parameters from the old one
-                    
-                    # 1. If the old URL had a query component, transfer it
-                    if parsed_old_url.query:
-                        # Use regex to find the placeholder and the preceding search parameter name
-                        match_param = re.search(r'([a-zA-Z0-9_-]+)=\{\}', parsed_old_url.query)
-                        if match_param:
-                            # Reconstruct the query string using the correct parameter and the placeholder
-                            query_parts = []
-                            for part in parsed_old_url.query.split('&'):
-                                if part.endswith('={}'):
-                                    query_parts.append(part)
-                                else:
-                                    # Keep other query parameters (if any)
-                                    query_parts.append(part)
-                            
-                            new_url += '?' + '&'.join(query_parts)
-                        else:
-                            # Fallback if no clean param= found, just append the full query/placeholder to be safe
-                            new_url += '?' + parsed_old_url.query
-                        
-                        # Simple check to ensure placeholder is present, if the above logic missed it
-                        if '{}' not in new_url:
-                            new_url += '&s={}' # Common fallback search parameter
-                            
-                    # 2. Check for path-based placeholder (e.g., /search/{})
-                    elif '{}' in parsed_old_url.path:
-                        # Re-add the placeholder to the new URL's path if it was in the old path
-                        new_url = new_url.replace(parsed_old_url.path, parsed_old_url.path) # Path is already preserved, so this is mostly defensive
-                        
-                    # 3. Final safety net: If placeholder is still missing, add the simple search query
-                    if '{}' not in new_url:
-                        new_url = new_url.rstrip('/') + '/?s={}'
-                        
-                else:
-                    # If the old URL did not have a placeholder, assume it's a domain-only site (e.g. for Direct Downloads/Torrents) or a link that doesn't need a search term.
-                    # We only replace the scheme and netloc, keeping the path/query/fragment of the old URL intact.
-                    new_url = new_scheme_netloc + parsed_old_url.path
-                    if parsed_old_url.query:
-                        new_url += '?' + parsed_old_url.query
-                    if parsed_old_url.fragment:
-                        new_url += '#' + parsed_old_url.fragment
-
-                found_match = {
-                    'category_name': category_name,
-                    'category_filename': category_filename,
-                    'old_url': old_url,
-                    'new_url': new_url
-                }
-                break 
-        if found_match:
-            break
+    Returns:
+        A list of PIDs, or None if the process table is not available on this OS.
+    """
+    if not os.path.isdir(PROC_DIR):
+        return None
+
+    real_path = os.path.realpath(browser_path)
+    names = {os.path.splitext(os.path.basename(p))[0] for p in (browser_path, real_path)}
+    # Launchers like /usr/bin/google-chrome are symlinks into the real install folder
+    install_dir = os.path.dirname(real_path) if real_path != browser_path else None
+    # ...but never treat a shared bin folder as an install folder
+    if install_dir and os.path.basename(install_dir) in ('bin', 'sbin'):
+        install_dir = None
+
+    pids = []
+    own_pid = os.getpid()
+    for entry in os.listdir(PROC_DIR):
+        if not entry.isdigit() or int(entry) == own_pid:
+            continue
+        try:
+            exe = os.readlink(os.path.join(PROC_DIR, entry, 'exe'))
+        except OSError:
+            exe = ''
+        if not exe:
+            try:
+                with open(os.path.join(PROC_DIR, entry, 'cmdline'), 'rb') as f:
+                    exe = f.read().split(b'\0')[0].decode('utf-8', 'replace')
+            except OSError:
+                continue
+        if os.path.basename(exe) in names or (install_dir and os.path.dirname(exe) == install_dir):
+            pids.append(int(entry))
+    return pids
 
-    if not found_match:
-        print(f"😔 No existing sites found containing the brand name **{base_name}**. Update cancelled.")
-        return
-        
-    match = found_match
-    old_url = match['old_url']
-    new_url = match['new_url']
-    category_name = match['category_name']
-    category_filename = match['category_filename']
+def ensure_browser_ready(browser_path, browser_name):
+    """
+    Skips the cold start when the browser is already running. Otherwise starts it and polls
+    until it has spawned its helper processes (or the short timeout runs out).
     
-    print(f"\n✅ Found existing URL to replace in file **{category_filename}**:")
-    print(f"-> Category: {category_name} | OLD URL: {old_url}")
+    Returns:
+        True if tabs can be opened, False if the browser could not be launched.
+    """
+    with PhaseTimer('browser_check') as timer:
+        running_pids = find_browser_pids(browser_path)
+        timer.details['running'] = bool(running_pids)
+    if running_pids:
+        print(f"\n{browser_name} is already awake for you, my sweet tech king 😈💋")
+        return True
 
-    # Final check: Ensure the placeholder is still in the new URL IF it was in the old URL
-    if '{}' in old_url and '{}' not in new_url:
-        # This is a critical fallback for complex cases the logic above might have missed
-        print("🚨 CRITICAL WARNING: The placeholder '{}' is missing from the calculated NEW URL.")
-        # Re-apply the most common search query format as a final fix
-        if '?' in new_url:
-            new_url += '&s={}'
-        else:
-            new_url += '/?s={}'
-        print(f"🤖 Final Auto-corrected New URL to: **{new_url}**")
-    
-    # Check if the new URL is identical to the old one after processing
-    if new_url.strip() == old_url.strip():
-        print("⚠️ The old and new URLs appear identical after processing. Update skipped.")
-        return
+    print(f"\nWaking up {browser_name} for you, my sweet tech king 😈💋")
+    try:
+        with PhaseTimer('browser_spawn'):
+            subprocess.Popen([browser_path])
+    except Exception as e:
+        print(f"Failed to launch browser process: {e}")
+        return False
+
+    if running_pids is None:
+        # No process table to poll, keep the old fixed warm-up
+        with PhaseTimer('browser_warmup', fixed=True):
+            time.sleep(BROWSER_WARMUP_FALLBACK)
+        return True
+
+    # Modern browsers are multi-process: once helpers appear, the main process takes remote tabs
+    with PhaseTimer('browser_warmup', fixed=False) as timer:
+        deadline = time.monotonic() + BROWSER_READY_TIMEOUT
+        timer.details['timed_out'] = True
+        while time.monotonic() < deadline:
+            if len(find_browser_pids(browser_path)) >= 2:
+                timer.details['timed_out'] = False
+                break
+            time.sleep(BROWSER_READY_POLL_INTERVAL)
+    return True
 
 
-    # 2. Confirmation and Save (File modification)
-    print(f"\nConfirm Replacement:")
-    print(f"CATEGORY: {category_name}")
-    print(f"OLD: {old_url}")
-    print(f"NEW: {new_url}")
-    confirm = input("Proceed with update? (Y/N): ").strip().upper()
+# --- ADAPTIVE PACING ---
 
-    if confirm == 'Y':
-        file_path = os.path.join(SITES_DATA_DIR, category_filename)
+def read_load_per_cpu():
+    """1-minute load average divided by the number of CPU cores, or None without /proc."""
+    try:
+        with open(os.path.join(PROC_DIR, 'loadavg'), 'r') as f:
+            load = float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return load / (os.cpu_count() or 1)
+
+def read_available_memory_mb():
+    """MemAvailable from /proc/meminfo in MB, or None without /proc."""
+    try:
+        with open(os.path.join(PROC_DIR, 'meminfo'), 'r') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+def read_browser_rss_mb(browser_path):
+    """Total resident memory of the browser's processes in MB, or None without /proc."""
+    pids = find_browser_pids(browser_path) if browser_path else None
+    if pids is None:
+        return None
+
+    total_kb = 0
+    for pid in pids:
         try:
-            # Read all lines from the file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Find the old URL line (strip whitespace for matching) and replace it
-            updated_lines = []
-            replaced = False
-            for line in lines:
-                if line.strip() == old_url.strip():
-                    updated_lines.append(new_url + '\n')
-                    replaced = True
-                else:
-                    updated_lines.append(line)
-            
-            if replaced:
-                # Write all lines back to the file
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.writelines(updated_lines)
-                
-                print(f"🥳 Successfully updated **{base_name}** site in **{category_filename}**!")
-                
-                log_site_update(category_name, old_url, new_url)
-                
-                global LAST_UPDATED_SITES
-                LAST_UPDATED_SITES.append({
-                    'category': category_name,
-                    'old_url': old_url,
-                    'new_url': new_url
-                })
-            else:
-                print("🚨 Error: Could not find the old URL in the file during rewrite. File not modified.")
-                
-        except Exception as e:
-            print(f"🚨 Error modifying file {category_filename}: {e}")
-        
-    else:
-        print("Update cancelled by user.")
+            with open(os.path.join(PROC_DIR, str(pid), 'status'), 'r') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total_kb += int(line.split()[1])
+                        break
+        except (OSError, ValueError, IndexError):
+            continue # The process exited while we were looking
+    return total_kb / 1024
+
+class TabPacer:
+    """
+    Chooses the batch size and per-tab delay before each batch (see PACING).
+    A fixed batch_size (e.g. from --batch-size) is always honoured; only the delay adapts then.
+    """
+
+    def __init__(self, browser_path=None, batch_size=None):
+        self.browser_path = browser_path
+        self.fixed_batch = batch_size
+        self.batch_size = batch_size or PACING['start_batch']
+        self.delay = PACING['start_delay']
+        self.pressure = None
+
+    def measure_pressure(self):
+        """
+        Returns how close the system is to its limits: above 1.0 means at least one limit is exceeded,
+        None means nothing could be measured.
+        """
+        ratios = []
+        load = read_load_per_cpu()
+        if load is not None:
+            ratios.append(load / PACING['max_load_per_cpu'])
+        available = read_available_memory_mb()
+        if available is not None:
+            ratios.append(PACING['min_available_mb'] / max(available, 1))
+        browser_rss = read_browser_rss_mb(self.browser_path)
+        if browser_rss is not None:
+            ratios.append(browser_rss / PACING['max_browser_rss_mb'])
+        return max(ratios) if ratios else None
+
+    def next_pace(self):
+        """Adjusts and returns (batch_size, delay) for the next batch."""
+        if not PACING['enabled']:
+            return self.batch_size, self.delay
+
+        self.pressure = self.measure_pressure()
+        if self.pressure is None:
+            return self.batch_size, self.delay
+
+        if self.pressure > 1.0:
+            # Back off quickly when the machine or the browser is struggling
+            self.batch_size = max(PACING['min_batch'], self.batch_size // 2)
+            self.delay = min(PACING['max_delay'], self.delay * 2)
+        elif self.pressure < 0.5:
+            # Speed up gently while there's plenty of headroom
+            self.batch_size = min(PACING['max_batch'], self.batch_size + 1)
+            self.delay = max(PACING['min_delay'], self.delay * 0.75)
+
+        if self.fixed_batch:
+            self.batch_size = self.fixed_batch
+        return self.batch_size, self.delay
 
 
 # --- CORE SEARCH LOGIC ---
@@ -820,7 +2899,9 @@ def auto_update_site_url(sites_data):
 def show_menu(logging_status, sites):
     """Displays the main menu with the logging toggle status in the preferred sectioned style. (MODIFIED)"""
     log_state = "ON 📝" if logging_status else "OFF 👻"
-    browser_name = BROWSERS[load_config()['browser_id']][0] if load_config()['browser_id'] else "Default"
+    report_backup_job()
+    browser_id = get_config()['browser_id']
+    browser_name = BROWSERS[browser_id][0] if browser_id else "Default"
     
     print("\nWelcome to your naughty launcher, baby 😈💻")
     print("Choose what you’re craving today~ 💋")
@@ -828,99 +2909,402 @@ def show_menu(logging_status, sites):
     # Dynamically display categories, using the sorted keys to ensure alphabetical order from load_sites
     category_keys = sorted(sites.keys())
     for key in category_keys:
-        # sites[key] is (Name, Filename, [URLs])
-        print(f"{key}. {sites[key][0]}") 
+        # sites[key] is a Category (name, filename, entries)
+        print(f"{key}. {sites[key].name}") 
         
     # --- Top Section ---
     print(f"\nL. Toggle Search Logging (Current Status: {log_state})")
     print("V. View Search Log 📄")
     print("C. Clear Search Log 🔥")
     print(f"T. **Settings** ⚙️ (Browser: {browser_name} / Path / Tabs)")
+    print("Q. **Search Queue** 📋 (Many Keywords / Categories, One Session)")
+    print("X. **Cross-Category Search** 🔀 (One Keyword, No Duplicate Tabs)")
     print("------------------------------------------")
 
     # --- Site Management Section ---
     print("W. Website URL Updater 🤖 (Automatic)")
+    print("M. **Bulk URL Updater** 🗂️ (Old → New Mapping File)")
     print("A. **Add Single Site** ➕") 
     print("B. **Add Sites Batch** 📁") # Changed from 'G' to 'B'
     print("N. **New Category** 🆕")
     print("D. **Remove Site** 🗑️ (By URL/Hostname)")
     print("S. Edit Sites Info / **View All Site Files**")
+    print("K. **Site Storage** 🗄️ (Text Files / SQLite Database)")
     print("------------------------------------------")
 
     # --- Utilities/Review Section ---
     print("R. Review Sites File 📄 (See **Current Session** Updates)")
     print("U. View Site **Update History** 📜 (Persistent Log)")
     print("P. View Site **Deletion History** 🗑️ (Persistent Log)")
-    print("Z. **Backup** UltimateSearcher Files 💾 (to Downloads as ZIP)")
+    print("Z. **Backup** UltimateSearcher Files 💾 (Full ZIP / Incremental / Restore)")
+    print("I. **Timing Metrics** ⏱️ (p50/p95 per Phase)")
     print("0. Exit 😢")
 
-def run_search(category_info, raw_keyword, browser_data, category_name, is_logging_enabled):
-    if not raw_keyword:
-        print("You forgot to whisper your desire, darling 😳")
-        return
+def get_tab_browser(browser_path, browser_name):
+    """
+    Returns a webbrowser controller for browser_path, registering it on first use.
+    webbrowser is only imported here, since multi-URL browsers never need it.
+    """
+    if browser_path in TAB_BROWSERS:
+        return TAB_BROWSERS[browser_path]
+
+    import webbrowser
+    try:
+        webbrowser.register('custom_browser', None, webbrowser.BackgroundBrowser(browser_path))
+        browser = webbrowser.get('custom_browser')
+    except webbrowser.Error:
+        print(f"Could not register {browser_name}. Opening tabs using the system default browser instead.")
+        browser = webbrowser.get() 
+    TAB_BROWSERS[browser_path] = browser
+    return browser
+
+# --- LAUNCH BACKENDS ---
+
+class LaunchBackend(ABC):
+    """
+    Opens batches of rendered URLs for execute_launch_plan. Subclasses decide how.
+    Backends with needs_browser = False never touch a real browser, so the path check
+    and warm-up are skipped for them.
+    """
+    name = 'base'
+    needs_browser = True
+
+    @abstractmethod
+    def open_batch(self, urls, tab_delay=0):
+        """Opens one batch; tab_delay is the pacer's delay between tabs, for backends that open them one by one."""
+
+    def close(self):
+        """Called once the plan is done (or aborted)."""
 
+class WebbrowserBackend(LaunchBackend):
+    """Opens tabs one by one through a registered webbrowser controller (works with any browser)."""
+    name = 'webbrowser'
+
+    def __init__(self, browser_path, browser_name):
+        self.browser_path = browser_path
+        self.browser_name = browser_name
+
+    def open_batch(self, urls, tab_delay=0):
+        browser = get_tab_browser(self.browser_path, self.browser_name)
+        for url in urls:
+            browser.open_new_tab(url)
+            time.sleep(tab_delay)
+
+class SubprocessBackend(LaunchBackend):
+    """
+    Opens a whole batch with a single browser invocation (browsers in MULTI_URL_BROWSER_KEYS).
+    Falls back to opening the tabs one by one if the browser can't be started that way.
+    """
+    name = 'subprocess'
+
+    def __init__(self, browser_path, browser_name):
+        self.browser_path = browser_path
+        self.fallback = WebbrowserBackend(browser_path, browser_name)
+
+    def open_batch(self, urls, tab_delay=0):
+        try:
+            subprocess.Popen([self.browser_path] + urls)
+        except Exception as e:
+            print(f"Batch launch failed ({e}). Opening tabs one by one instead.")
+            self.fallback.open_batch(urls, tab_delay)
+
+class DryRunBackend(LaunchBackend):
+    """Writes the rendered URLs, one per line, to a file (appending) or a stream (stdout by default) instead of opening them."""
+    name = 'dry-run'
+    needs_browser = False
+
+    def __init__(self, output_path=None, stream=None):
+        self.output_path = output_path
+        if output_path:
+            self.stream = open(output_path, 'a', encoding='utf-8')
+        else:
+            self.stream = stream or sys.stdout
+
+    def open_batch(self, urls, tab_delay=0):
+        self.stream.write(''.join(url + '\n' for url in urls))
+        self.stream.flush()
+
+    def close(self):
+        if self.output_path:
+            self.stream.close()
+
+class RecordingBackend(LaunchBackend):
+    """Keeps every batch in memory (self.batches) instead of opening it. For tests and benchmarks."""
+    name = 'recording'
+    needs_browser = False
+
+    def __init__(self):
+        self.batches = []
+
+    def open_batch(self, urls, tab_delay=0):
+        self.batches.append(list(urls))
+
+    @property
+    def urls(self):
+        return [url for batch in self.batches for url in batch]
+
+# Backends that can be picked on the command line (--backend); 'auto' follows the browser's abilities
+LAUNCH_BACKEND_CHOICES = ('auto', 'subprocess', 'webbrowser', 'dry-run')
+
+def make_launch_backend(browser_data, choice='auto', output_path=None, stream=None):
+    """
+    Builds the launch backend for a browser. 'auto' uses one process per batch where the browser
+    supports it; output_path/stream only apply to 'dry-run'.
+    """
     browser_name, browser_paths, browser_key = browser_data
     browser_path = browser_paths.get(CURRENT_OS)
+
+    if choice == 'dry-run':
+        return DryRunBackend(output_path, stream)
+    if choice == 'subprocess' or (choice == 'auto' and BATCH_LAUNCH_ENABLED and browser_key in MULTI_URL_BROWSER_KEYS):
+        return SubprocessBackend(browser_path, browser_name)
+    return WebbrowserBackend(browser_path, browser_name)
+
+def run_search(category_info, raw_keyword, browser_data, category_name, is_logging_enabled, batch_size=None, pause=True):
+    """
+    Opens every site of a category for one keyword, in batches (batch_size tabs each if given, else paced by TabPacer).
+    With pause=False all batches are opened without waiting for Enter (command-line mode).
     
-    # Use quote_plus for most search queries (replaces spaces with '+')
-    default_query = urllib.parse.quote_plus(raw_keyword)
-    # Use standard quote for Z-Library and others that might break with '+'
-    zlib_query = urllib.parse.quote(raw_keyword) 
+    Returns:
+        True if the tabs were handed to the browser, False otherwise.
+    """
+    if not raw_keyword:
+        print("You forgot to whisper your desire, darling 😳")
+        return False
 
-    if is_logging_enabled:
-        log_search(raw_keyword, category_name)
-        print(f"🤫 Search query logged to {LOG_FILE_PATH}")
+    # The plan is logged under category_name, the menu name the user picked
+    plan = build_launch_plan([Category(category_name, category_info.filename, category_info.entries)], [raw_keyword])
+    return execute_launch_plan(plan, browser_data, is_logging_enabled, batch_size, pause)
 
-    if not browser_path or not os.path.exists(browser_path):
-        print(f"{browser_name} isn’t there, baby 💔 Check the path in the script again for your OS ({CURRENT_OS}). Expected path: {browser_path if browser_path else 'Not Defined'}")
-        return
 
-    print(f"\nWaking up {browser_name} for you, my sweet tech king 😈💋")
-    try:
-        subprocess.Popen(f'"{browser_path}"')
-    except Exception as e:
-        print(f"Failed to launch browser process: {e}")
-        return
+# --- SEARCH QUEUE ---
 
-    time.sleep(2)
+def parse_keyword_list(text):
+    """Splits a ';'-separated keyword list, dropping blanks and repeats (first occurrence wins)."""
+    return list(dict.fromkeys(keyword.strip() for keyword in text.split(';') if keyword.strip()))
 
-    try:
-        webbrowser.register('custom_browser', None, webbrowser.BackgroundBrowser(browser_path))
-        browser = webbrowser.get('custom_browser')
-    except webbrowser.Error:
-        print(f"Could not register {browser_name}. Opening tabs using the system default browser instead.")
-        browser = webbrowser.get() 
+def read_keyword_file(file_path):
+    """Reads one keyword per line from a text file ('#' lines are comments), dropping blanks and repeats."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        lines = [line.strip() for line in f]
+    return list(dict.fromkeys(line for line in lines if line and not line.startswith('#')))
 
-    # The URLs list is the third element in the tuple (Name, Filename, [URLs])
-    urls_list = category_info[2] 
+def build_launch_plan(categories, keywords):
+    """
+    Expands keywords x categories into a single launch plan, rendering every URL up front.
+    Each keyword is encoded once, however many categories it is searched in.
     
-    for i in range(0, len(urls_list), 5):
-        for site in urls_list[i:i + 5]:
-            
-            # --- Special Handler Logic ---
-            search_term = default_query
-            
-            # Use Zlib encoding (standard URL quote) for sites that require it
-            if "z-library.gs" in site or "ankergames.net" in site:
-                search_term = zlib_query
-            
-            # Custom handler for the '1tamilmv' URL in the GDrive category
-            if category_name == "Movies (GDrive Links)" and "1tamilmv" in site:
-                search_term = urllib.parse.quote(raw_keyword)
+    Returns:
+        A list of (keyword, category_name, [urls]) steps, keyword by keyword.
+    """
+    plan = []
+    with PhaseTimer('plan_render') as timer:
+        for keyword in keywords:
+            encoded_terms = encode_search_terms(keyword)
+            for category in categories:
+                urls = [entry.render(encoded_terms) for entry in category.entries]
+                if urls:
+                    plan.append((keyword, category.name, urls))
+        timer.details['urls'] = sum(len(urls) for _, _, urls in plan)
+    return plan
+
+def url_dedupe_key(url):
+    """
+    Identifies the page a rendered URL opens: host (see normalize_host), path without a trailing '/',
+    and the decoded, sorted query. Scheme and fragment are ignored.
+    """
+    parsed = urlparse(url)
+    query = tuple(sorted(urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)))
+    return normalize_host(url), parsed.path.rstrip('/'), query
 
-            try:
-                browser.open_new_tab(site.format(search_term))
-                time.sleep(0.5)
-            except IndexError:
-                # Handle cases where the URL is missing the {} placeholder and .format() fails
-                print(f"🚨 WARNING: Site URL is malformed (missing '{{}}' placeholder): {site}. Skipping.")
+def dedupe_launch_plan(plan):
+    """
+    Drops URLs that an earlier step of the plan already opens for the same keyword
+    (e.g. a host listed in two categories), keeping the first occurrence.
+    
+    Returns:
+        A tuple (deduplicated_plan, removed_count).
+    """
+    seen = set()
+    deduped = []
+    removed = 0
+    for keyword, category_name, urls in plan:
+        unique_urls = []
+        for url in urls:
+            key = (keyword, url_dedupe_key(url))
+            if key in seen:
+                removed += 1
                 continue
+            seen.add(key)
+            unique_urls.append(url)
+        if unique_urls:
+            deduped.append((keyword, category_name, unique_urls))
+    return deduped, removed
 
+def execute_launch_plan(plan, browser_data, is_logging_enabled, batch_size=None, pause=True, backend=None):
+    """
+    Runs a launch plan as one paced session: the searches are logged in one batch, the browser
+    is checked (and warmed up) once, and tabs open in batches across the whole plan.
+    Tabs are opened by `backend` (see make_launch_backend for the default). For a real browser the
+    batch size and delays follow the system load (TabPacer), unless batch_size fixes the size.
+    
+    Returns:
+        True if the tabs were handed to the backend, False otherwise.
+    """
+    browser_name, browser_paths, _ = browser_data
+    browser_path = browser_paths.get(CURRENT_OS)
+    if backend is None:
+        backend = make_launch_backend(browser_data)
 
-        if i + 5 < len(urls_list):
-            input("Press Enter to open more sinful tabs 😈")
+    if is_logging_enabled and plan:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        SEARCH_LOG_WRITER.write_many([(timestamp, category_name, keyword) for keyword, category_name, _ in plan])
+        if len(plan) == 1:
+            print(f"🤫 Search query logged to {SEARCH_LOG_DB_PATH}")
         else:
-            print("All done, my king 💻💋 Go enjoy your treasures~")
+            print(f"🤫 {len(plan)} search queries logged to {SEARCH_LOG_DB_PATH}")
+
+    if backend.needs_browser and (not browser_path or not os.path.exists(browser_path)):
+        print(f"{browser_name} isn’t there, baby 💔 Check the path in the script again for your OS ({CURRENT_OS}). Expected path: {browser_path if browser_path else 'Not Defined'}")
+        return False
+
+    # Batches run straight across keyword/category boundaries, so the session is paced as a whole
+    tab_queue = [(keyword, category_name, url) for keyword, category_name, urls in plan for url in urls]
+    with PhaseTimer('search_total', tabs=len(tab_queue), batch_size=batch_size, pause=pause, backend=backend.name):
+        if backend.needs_browser and not ensure_browser_ready(browser_path, browser_name):
+            return False
+
+        # Backends without a browser have nothing to pace
+        pacer = TabPacer(browser_path, batch_size) if backend.needs_browser else None
+        current_step = None
+        i = 0
+        while i < len(tab_queue):
+            if pacer:
+                current_batch_size, tab_delay = pacer.next_pace()
+            else:
+                current_batch_size, tab_delay = batch_size or PACING['start_batch'], 0
+            batch = tab_queue[i:i + current_batch_size]
+            i += len(batch)
+            if len(plan) > 1:
+                for keyword, category_name, _ in batch:
+                    if (keyword, category_name) != current_step:
+                        current_step = (keyword, category_name)
+                        print(f"🔎 '{keyword}' in {category_name}")
+
+            # Hand the whole batch to the browser in one go
+            with PhaseTimer('tab_open', tabs=len(batch), delay=tab_delay, pressure=pacer.pressure if pacer else None):
+                backend.open_batch([url for _, _, url in batch], tab_delay)
+
+            if i < len(tab_queue):
+                # Backends without a browser have nothing to wait for between batches either
+                if pause and backend.needs_browser:
+                    try:
+                        with PhaseTimer('interactive_pause'):
+                            input("Press Enter to open more sinful tabs 😈")
+                    except EOFError:
+                        print(f"\nNo more input, so I'm stopping here 💔 ({len(tab_queue) - i} tabs left unopened)")
+                        break
+                else:
+                    time.sleep(tab_delay) # Let the browser catch up before the next batch
+            else:
+                print("All done, my king 💻💋 Go enjoy your treasures~")
+
+    return True
+
+def parse_category_choices(text, sites):
+    """
+    Turns a menu answer like '1,3' or 'all' into a list of categories from load_sites().
+    
+    Returns:
+        A list of Category objects, or None if a number isn't on the menu.
+    """
+    if text.strip().lower() == 'all':
+        return [sites[key] for key in sorted(sites)]
+
+    chosen = []
+    for part in text.replace(' ', ',').split(','):
+        if not part:
+            continue
+        if not part.isdigit() or int(part) not in sites:
+            return None
+        if sites[int(part)] not in chosen:
+            chosen.append(sites[int(part)])
+    return chosen
+
+def search_queue(sites, browser_data, is_logging_enabled):
+    """
+    Searches a list of keywords (typed in, or read from a text file) in one or more categories,
+    as a single launch session. (Q. Search Queue)
+    """
+    print("\n--- Search Queue 📋 (Many Keywords, One Session) ---")
+    for key in sorted(sites):
+        print(f"{key}. {sites[key].name} ({len(sites[key].entries)} sites)")
+
+    categories = parse_category_choices(input("\nWhich categories, darling? (e.g. 1,3 or 'all'): "), sites)
+    if not categories:
+        print("That’s not on the list, silly 😘 Search queue cancelled.")
+        return
+    categories = [category for category in categories if category.entries]
+    if not categories:
+        print("🚨 Those lists are all empty! Search queue cancelled.")
+        return
+
+    answer = input("Type your keywords separated by ';' (or 'F' to load them from a .txt file, one per line): ").strip()
+    if answer.upper() == 'F':
+        file_path = ask_for_text_file("Select Keyword List (.txt)")
+        if not file_path:
+            print("File selection cancelled. Search queue cancelled.")
+            return
+        try:
+            keywords = read_keyword_file(file_path)
+        except Exception as e:
+            print(f"🚨 Error reading keyword file: {e}")
+            return
+    else:
+        keywords = parse_keyword_list(answer)
+
+    if not keywords:
+        print("You forgot to whisper your desire, darling 😳")
+        return
+
+    plan, duplicates = dedupe_launch_plan(build_launch_plan(categories, keywords))
+    total_tabs = sum(len(urls) for _, _, urls in plan)
+    print(f"\n📋 {len(keywords)} keyword(s) x {len(categories)} categor{'y' if len(categories) == 1 else 'ies'} = **{total_tabs} tabs**")
+    if duplicates:
+        print(f"🧹 {duplicates} duplicate tab(s) skipped (same site listed in several categories).")
+    if input("Open them all, a batch at a time? (Y/N): ").strip().upper() != 'Y':
+        print("Search queue cancelled.")
+        return
+
+    execute_launch_plan(plan, browser_data, is_logging_enabled)
+
+def cross_category_search(sites, browser_data, is_logging_enabled):
+    """
+    Searches one keyword across several categories at once, opening every unique page only once
+    even when a site is listed in more than one of them. (X. Cross-Category Search)
+    """
+    print("\n--- Cross-Category Search 🔀 (Duplicates Removed) ---")
+    for key in sorted(sites):
+        print(f"{key}. {sites[key].name} ({len(sites[key].entries)} sites)")
+
+    categories = parse_category_choices(input("\nWhich categories, darling? (e.g. 1,3 or 'all'): "), sites)
+    if not categories:
+        print("That’s not on the list, silly 😘 Search cancelled.")
+        return
+    categories = [category for category in categories if category.entries]
+    if not categories:
+        print("🚨 Those lists are all empty! Search cancelled.")
+        return
+
+    keyword = input("What are we hunting across all of them, love? 🔍: ").strip()
+    if not keyword:
+        print("You forgot to whisper your desire, darling 😳")
+        return
+
+    plan, duplicates = dedupe_launch_plan(build_launch_plan(categories, [keyword]))
+    if duplicates:
+        print(f"🧹 {duplicates} duplicate tab(s) skipped (same site listed in several categories).")
+    execute_launch_plan(plan, browser_data, is_logging_enabled)
 
 
 def select_browser(current_config):
@@ -955,9 +3339,352 @@ def select_browser(current_config):
             print("Oopsie~ That wasn’t a number, my cutie 😅")
 
 
+# --- COMMAND-LINE MODE ---
+
+def parse_args(argv=None):
+    """Parses the command-line options. Without --category/--keyword the interactive menu runs."""
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Open the search sites of one or more categories for one or more keywords. Run without options for the interactive menu."
+    )
+    parser.add_argument('-c', '--category', nargs='+', metavar='CATEGORY', help="category name (e.g. 'Movies DDL'), file name in SiteUrls, or path to a site .txt file")
+    parser.add_argument('-k', '--keyword', nargs='+', metavar='KEYWORD', help="one or more search keywords")
+    parser.add_argument('-f', '--keyword-file', help="text file with one keyword per line (added to any --keyword)")
+    parser.add_argument('-b', '--batch-size', type=int, help="tabs opened per batch (default: adapts to system load, starting at 5)")
+    parser.add_argument('--no-pause', action='store_true', help="open all batches without waiting for Enter (always the case without a terminal)")
+    parser.add_argument('--browser-path', help="browser executable to use instead of the saved browser preference")
+    parser.add_argument('--backend', choices=LAUNCH_BACKEND_CHOICES, default='auto',
+                        help="how tabs are opened: one process per batch (subprocess), one tab at a time (webbrowser), "
+                             "or not at all, printing the URLs instead (dry-run). Default: auto")
+    parser.add_argument('--dry-run', dest='backend', action='store_const', const='dry-run',
+                        help="print the URLs instead of opening them (same as --backend dry-run)")
+    parser.add_argument('-o', '--output', help="with --dry-run, append the URLs to this file instead of printing them")
+    parser.add_argument('--daemon', action='store_true',
+                        help=f"stay resident and take searches from searcher_client.py over {DAEMON_SOCKET_PATH}")
+    args = parser.parse_args(argv)
+
+    has_keywords = args.keyword is not None or args.keyword_file is not None
+    if args.daemon and (args.category is not None or has_keywords):
+        parser.error("--daemon takes its searches from the client, not from --category/--keyword")
+    if (args.category is None) == has_keywords:
+        parser.error("--category and --keyword/--keyword-file must be used together")
+    if args.category is None and not args.daemon:
+        parser.error("search options need --category and --keyword/--keyword-file (run without options for the menu)")
+    if args.batch_size is not None and args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    if args.output and args.backend != 'dry-run':
+        parser.error("--output only works with --dry-run")
+    return args
+
+def find_category_file(category, site_files):
+    """
+    Resolves a category given by name, SiteUrls file name or path, without loading every category.
+    site_files is the {file_path: stamp} listing to search (scan_site_files() or scan_sites_db()).
+    
+    Returns:
+        The path of the category file, or None if nothing matches.
+    """
+    if os.path.isfile(category):
+        return os.path.abspath(category)
+
+    wanted = category.strip().lower()
+    for file_path in site_files:
+        filename = os.path.basename(file_path)
+        stem = os.path.splitext(filename)[0]
+        if wanted in (filename.lower(), stem.lower(), stem.replace('_', ' ').lower()):
+            return file_path
+    return None
+
+def load_category(category):
+    """Parses only the requested category file (or database category). Returns its Category or None."""
+    conn = open_sites_db() if sites_db_enabled() else None
+    try:
+        site_files = scan_sites_db(conn) if conn is not None else scan_site_files()
+        file_path = find_category_file(category, site_files)
+        if file_path is None:
+            return None
+        stamp = site_files.get(file_path)
+        if stamp is None: # A category file given by path, outside SiteUrls
+            stat = os.stat(file_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = SITES_CACHE.get(file_path)
+        # Unchanged files are served from the cache (the daemon resolves categories on every request)
+        if not (cached and cached[0] == stamp) and not parse_site_file(file_path, stamp, conn):
+            return None
+        return SITES_CACHE[file_path][1]
+    finally:
+        if conn is not None:
+            conn.close()
+
+def browser_data_for_path(browser_path):
+    """Builds a BROWSERS-style entry for a browser executable given on the command line."""
+    name = os.path.splitext(os.path.basename(browser_path))[0]
+    lowered = name.lower()
+    if 'firefox' in lowered:
+        key = 'firefox'
+    elif any(chromium in lowered for chromium in ('chrome', 'chromium', 'brave', 'edge')):
+        key = 'chrome'
+    else:
+        key = None # Unknown browser: open tabs one by one
+    return (name.title(), {CURRENT_OS: browser_path}, key)
+
+def run_cli(args):
+    """Headless search: no menu, no full site reload. Returns the process exit code."""
+    url_stream = sys.stdout
+    # A dry run to stdout prints nothing but URLs there (all chatter goes to stderr), so the list can be piped
+    if args.backend == 'dry-run' and not args.output:
+        with contextlib.redirect_stdout(sys.stderr):
+            return run_cli_search(args, url_stream)
+    return run_cli_search(args, url_stream)
+
+def run_cli_search(args, url_stream):
+    """Loads the requested categories and keywords and runs them as one launch session. Returns the exit code."""
+    with PhaseTimer('config_load'):
+        config = get_config(announce=False)
+
+    categories = []
+    with PhaseTimer('site_load', categories=len(args.category)):
+        for category in args.category:
+            category_info = load_category(category)
+            if category_info is None:
+                print(f"🚨 Category '{category}' not found in {SITES_DATA_DIR}.")
+                return 2
+            if not category_info.entries:
+                print(f"🚨 The '{category_info.name}' list is empty! Add URLs to **{category_info.filename}** and try again.")
+                return 2
+            categories.append(category_info)
+
+    keywords = [keyword.strip() for keyword in args.keyword or [] if keyword.strip()]
+    if args.keyword_file:
+        try:
+            keywords += read_keyword_file(args.keyword_file)
+        except Exception as e:
+            print(f"🚨 Error reading keyword file: {e}")
+            return 2
+    keywords = list(dict.fromkeys(keywords))
+    if not keywords:
+        print("You forgot to whisper your desire, darling 😳")
+        return 2
+
+    if args.browser_path:
+        browser_data = browser_data_for_path(args.browser_path)
+    elif config['browser_id'] is not None:
+        browser_data = BROWSERS[config['browser_id']]
+    elif args.backend == 'dry-run':
+        browser_data = ("Dry run", {}, None) # No browser needed to print URLs
+    else:
+        print("🚨 No browser chosen yet. Run the script once without options to pick one, or pass --browser-path.")
+        return 2
+
+    try:
+        backend = make_launch_backend(browser_data, args.backend, args.output, url_stream)
+    except OSError as e:
+        print(f"🚨 Could not open the output file: {e}")
+        return 2
+
+    if config['logging_enabled']:
+        prepare_search_log()
+
+    try:
+        # Every keyword/category pair goes into one launch session, each unique page opened once
+        plan, duplicates = dedupe_launch_plan(build_launch_plan(categories, keywords))
+        if duplicates:
+            print(f"🧹 {duplicates} duplicate tab(s) skipped (same site listed in several categories).")
+        success = execute_launch_plan(
+            plan,
+            browser_data,
+            config['logging_enabled'],
+            batch_size=args.batch_size,
+            # Hotkeys and other tools have no terminal to press Enter in
+            pause=not args.no_pause and sys.stdin.isatty(),
+            backend=backend
+        )
+    finally:
+        backend.close()
+    return 0 if success else 1
+
+
+# --- DAEMON MODE ---
+
+# One search at a time hands tabs to the browser, so batches from two requests never interleave
+DAEMON_LAUNCH_LOCK = threading.Lock()
+
+# Held while a request reads (and possibly refreshes) the shared site registry
+DAEMON_REGISTRY_LOCK = threading.Lock()
+
+def daemon_is_running():
+    """True if a daemon already answers on DAEMON_SOCKET_PATH."""
+    import socket
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(DAEMON_SOCKET_PATH):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(DAEMON_SOCKET_PATH)
+            return True
+        except OSError:
+            return False
+
+def as_text_list(value, field):
+    """Accepts a string or a list of strings from a daemon request and returns the non-empty ones."""
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"'{field}' must be a string or a list of strings")
+    return [item.strip() for item in value if item.strip()]
+
+def prepare_daemon_search(request):
+    """
+    Validates a search request and renders its launch plan from the in-memory registry.
+    
+    Returns:
+        A tuple (plan, duplicates, batch_size). Raises ValueError for a bad request.
+    """
+    categories = []
+    for category in as_text_list(request.get('category'), 'category'):
+        category_info = load_category(category)
+        if category_info is None:
+            raise ValueError(f"category '{category}' not found in {SITES_DATA_DIR}")
+        if not category_info.entries:
+            raise ValueError(f"the '{category_info.name}' list is empty")
+        categories.append(category_info)
+    if not categories:
+        raise ValueError("no category given")
+
+    keywords = list(dict.fromkeys(as_text_list(request.get('keyword'), 'keyword')))
+    if not keywords:
+        raise ValueError("no keyword given")
+
+    batch_size = request.get('batch_size')
+    if batch_size is not None and (not isinstance(batch_size, int) or batch_size < 1):
+        raise ValueError("'batch_size' must be a whole number of at least 1")
+
+    plan, duplicates = dedupe_launch_plan(build_launch_plan(categories, keywords))
+    return plan, duplicates, batch_size
+
+def run_daemon(args):
+    """
+    Resident mode: keeps the config, site registry and browser handle in memory and takes
+    newline-delimited JSON requests on DAEMON_SOCKET_PATH until Ctrl+C or a shutdown request.
+    Returns the process exit code.
+    """
+    import socket
+    import socketserver
+
+    if not hasattr(socket, 'AF_UNIX'):
+        print("🚨 Daemon mode needs Unix domain sockets, which this system doesn't offer. Use the command-line mode instead.")
+        return 2
+
+    try:
+        os.makedirs(ULTIMATE_SEARCHER_DIR, exist_ok=True)
+    except Exception as e:
+        print(f"CRITICAL: Failed to create necessary directory. Error: {e}")
+        return 1
+    if daemon_is_running():
+        print(f"😘 A daemon is already listening on {DAEMON_SOCKET_PATH}.")
+        return 1
+    if os.path.exists(DAEMON_SOCKET_PATH):
+        os.remove(DAEMON_SOCKET_PATH) # Left behind by a daemon that didn't shut down cleanly
+
+    rotate_logs()
+    config = get_config(announce=False)
+    if args.browser_path:
+        browser_data = browser_data_for_path(args.browser_path)
+    elif config['browser_id'] is not None:
+        browser_data = BROWSERS[config['browser_id']]
+    else:
+        print("🚨 No browser chosen yet. Run the script once without options to pick one, or pass --browser-path.")
+        return 2
+    sites = load_sites() # Warm the registry; requests only re-read files that changed since
+
+    class SearchRequestHandler(socketserver.StreamRequestHandler):
+        """Answers each request line with one JSON response line."""
+
+        def reply(self, response):
+            self.wfile.write((json.dumps(response, ensure_ascii=False) + '\n').encode('utf-8'))
+            self.wfile.flush()
+
+        def handle(self):
+            for line in self.rfile:
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("a request must be a JSON object")
+                except ValueError as e:
+                    self.reply({'ok': False, 'error': f"bad request: {e}"})
+                    continue
+
+                action = request.get('action', 'search')
+                if action == 'ping':
+                    self.reply({'ok': True, 'pid': os.getpid()})
+                elif action == 'categories':
+                    with DAEMON_REGISTRY_LOCK:
+                        names = [category.name for _, category in sorted(load_sites().items())]
+                    self.reply({'ok': True, 'categories': names})
+                elif action == 'shutdown':
+                    self.reply({'ok': True})
+                    threading.Thread(target=self.server.shutdown, name='daemon-shutdown').start()
+                    return
+                elif action == 'search':
+                    self.search(request)
+                else:
+                    self.reply({'ok': False, 'error': f"unknown action '{action}'"})
+
+        def search(self, request):
+            try:
+                with DAEMON_REGISTRY_LOCK:
+                    plan, duplicates, batch_size = prepare_daemon_search(request)
+            except ValueError as e:
+                self.reply({'ok': False, 'error': str(e)})
+                return
+
+            if request.get('dry_run'):
+                backend = RecordingBackend()
+                execute_launch_plan(plan, browser_data, False, batch_size, pause=False, backend=backend)
+                self.reply({'ok': True, 'tabs': len(backend.urls), 'duplicates': duplicates, 'urls': backend.urls})
+                return
+
+            # Answer right away; the (paced) launch runs after the client has its reply
+            self.reply({'ok': True, 'tabs': sum(len(urls) for _, _, urls in plan), 'duplicates': duplicates})
+            with DAEMON_LAUNCH_LOCK:
+                execute_launch_plan(plan, browser_data, get_config(announce=False)['logging_enabled'], batch_size, pause=False)
+
+    # The socket is created owner-only, so no other user can connect before it's locked down
+    old_umask = os.umask(0o077)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(DAEMON_SOCKET_PATH, SearchRequestHandler)
+    except OSError as e:
+        print(f"🚨 Could not listen on {DAEMON_SOCKET_PATH}: {e}")
+        return 1
+    finally:
+        os.umask(old_umask)
+    server.daemon_threads = True
+    os.chmod(DAEMON_SOCKET_PATH, 0o600) # Only you get to whisper to it
+
+    print(f"😈 Daemon ready with {len(sites)} categories and {browser_data[0]}, listening on {DAEMON_SOCKET_PATH} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(DAEMON_SOCKET_PATH):
+            os.remove(DAEMON_SOCKET_PATH)
+        flush_all_logs()
+    print("Okay baby 💔 Daemon stopped.")
+    return 0
+
+
 # --- MAIN EXECUTION ---
 
 if __name__ == "__main__":
+
+    # Scripted searches skip the menu entirely (a plain launch doesn't even need argparse)
+    if len(sys.argv) > 1:
+        cli_args = parse_args()
+        if cli_args.daemon:
+            sys.exit(run_daemon(cli_args))
+        if cli_args.category:
+            sys.exit(run_cli(cli_args))
     
     # 0. ENSURE THE DEDICATED FOLDER EXISTS
     try:
@@ -968,8 +3695,12 @@ if __name__ == "__main__":
         print(f"CRITICAL: Failed to create necessary directory. Error: {e}")
         sys.exit(1)
 
+    # Keep the persistent logs within their size/age limits
+    rotate_logs()
+
     # 1. Load configuration and sites
-    config = load_config()
+    with PhaseTimer('config_load'):
+        config = get_config()
 
     if config['browser_id'] is None:
         new_browser_id = select_browser(config)
@@ -980,7 +3711,9 @@ if __name__ == "__main__":
 
     # 2. Main menu loop
     while True:
-        sites = load_sites() # RELOAD SITES on every loop to pick up external changes immediately
+        with PhaseTimer('site_load') as timer:
+            sites = load_sites() # Cheap refresh: only new or changed site files are re-read
+            timer.details['categories'] = len(sites)
         
         # Exit if no sites are loaded (e.g., if user hasn't set up files yet)
         if not sites and os.path.exists(SITES_DATA_DIR):
@@ -989,9 +3722,10 @@ if __name__ == "__main__":
         show_menu(config['logging_enabled'], sites) 
         try:
             # Updated the prompt to reflect all available options
-            choice = input("\nType your choice, lover (or 'L'/'V'/'C'/'T'/'W'/'A'/'B'/'N'/'D'/'S'/'R'/'U'/'P'/'Z'): ").strip().upper()
+            choice = input("\nType your choice, lover (or 'L'/'V'/'C'/'T'/'Q'/'X'/'W'/'M'/'A'/'B'/'N'/'D'/'S'/'K'/'R'/'U'/'P'/'Z'/'I'): ").strip().upper()
 
             if choice == '0':
+                wait_for_backup_job()
                 print("Okay baby 💔 Come back when you wanna play again~")
                 break
             
@@ -1029,6 +3763,10 @@ if __name__ == "__main__":
                 auto_update_site_url(sites) 
                 continue
             
+            elif choice == 'M':
+                bulk_update_site_urls(sites)
+                continue
+            
             elif choice == 'A':
                 add_new_site(sites) 
                 continue
@@ -1051,6 +3789,10 @@ if __name__ == "__main__":
                 edit_sites_info()
                 continue
 
+            elif choice == 'K':
+                site_storage_menu(config)
+                continue
+
             # --- Utilities/Review Section ---
             elif choice == 'R':
                 review_updated_sites()
@@ -1065,25 +3807,37 @@ if __name__ == "__main__":
                 continue
 
             elif choice == 'Z':
-                create_backup()
+                backup_menu()
+                continue
+
+            elif choice == 'Q':
+                search_queue(sites, browser_data, config['logging_enabled'])
+                continue
+
+            elif choice == 'X':
+                cross_category_search(sites, browser_data, config['logging_enabled'])
+                continue
+
+            elif choice == 'I':
+                metrics_menu(config)
                 continue
 
             
             else:
                 choice_int = int(choice)
                 if choice_int in sites:
-                    # sites[choice_int] is (Name, Filename, [URLs])
+                    # sites[choice_int] is a Category (name, filename, entries)
                     category_info = sites[choice_int]
-                    category_name = category_info[0]
+                    category_name = category_info.name
                     
-                    if not category_info[2]:
-                        print(f"🚨 The '{category_name}' list is empty! Add URLs to **{category_info[1]}** and try again.")
+                    if not category_info.entries:
+                        print(f"🚨 The '{category_name}' list is empty! Add URLs to **{category_info.filename}** and try again.")
                         continue
                         
                     keyword = input(f"What {category_name.lower()} are we hunting today, love? 🔍: ").strip()
                                         
                     run_search(
-                        category_info, # Pass the entire tuple
+                        category_info, # Pass the whole Category
                         keyword,
                         browser_data,
                         category_name,
@@ -1096,4 +3850,6 @@ if __name__ == "__main__":
             print("Oopsie~ That wasn’t a valid input, my cutie 😅")
         except KeyboardInterrupt:
             print("\nOkay baby 💔 Come back when you wanna play again~")
+            flush_all_logs()
+            wait_for_backup_job()
             break
\ No newline at end of file
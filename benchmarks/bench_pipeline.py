@@ -0,0 +1,283 @@
+"""
+Benchmark suite for the site registry, URL rendering and launch pipeline of Ultimate Searcher.py.
+
+Generates synthetic SiteUrls trees in a temporary folder (your real files are never touched)
+and measures, per tree size:
+
+  load_sites (cold)    first load: every category file parsed and brand-indexed
+  load_sites (warm)    menu refresh with nothing changed
+  load_sites_db        the same two loads with the tree imported into the SQLite site database
+  brand match          one URL updater lookup (get_domain_base + find_brand_matches)
+  batch add            normalizing a 1,000-line batch-add file (normalize_batch_url)
+  render               building the launch plan of one keyword across every category
+  launch               running that plan through the recording backend (nothing is opened)
+
+Each operation reports latency percentiles (p50/p95/p99) and throughput in items per second.
+
+Usage:
+    python benchmarks/bench_pipeline.py                      # small + medium trees
+    python benchmarks/bench_pipeline.py --sizes large --repeat 3
+    python benchmarks/bench_pipeline.py --save-baseline baseline.json
+    python benchmarks/bench_pipeline.py --compare baseline.json [--threshold 0.10]
+
+With --compare the exit code is 1 if any p50 got slower than the baseline by more than the threshold.
+File system caches stay warm between runs, so "cold" means cold for the script's own caches.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from urllib.parse import urlparse
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Ultimate Searcher.py')
+
+# name: (category files, URLs per file)
+TREE_SIZES = {
+    'small': (10, 1000),     # 10k URLs
+    'medium': (500, 40),     # 20k URLs
+    'large': (5000, 20),     # 100k URLs
+}
+DEFAULT_SIZES = ('small', 'medium')
+
+BRAND_COUNT = 300
+TLDS = ('com', 'net', 'org', 'to', 'fo', 'gs', 'ms', 'promo', 'miami', 'cc')
+URL_SHAPES = (
+    "https://{www}{brand}.{tld}/?s={{}}",
+    "https://{www}{brand}.{tld}/search/{{}}",
+    "https://{www}{brand}.{tld}/search.php?q={{}}&page=1",
+    "https://{www}{brand}.{tld}/s/{{}} encoding=quote",
+)
+BATCH_FILE_LINES = 1000
+BRAND_LOOKUPS = 1000
+
+
+def load_searcher(home):
+    """Imports Ultimate Searcher.py as a module, with HOME pointing at the benchmark sandbox."""
+    os.environ['HOME'] = home
+    os.environ['USERPROFILE'] = home
+    spec = importlib.util.spec_from_file_location('ultimate_searcher', SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def brand_name(index):
+    return f"site{index:03d}x"
+
+
+def generate_tree(sites_dir, file_count, urls_per_file, rng):
+    """Writes file_count category files of urls_per_file site lines each (plus comments and blank lines)."""
+    os.makedirs(sites_dir)
+    for file_index in range(file_count):
+        lines = [f"# Synthetic category {file_index}", ""]
+        for _ in range(urls_per_file):
+            lines.append(rng.choice(URL_SHAPES).format(
+                www=rng.choice(('', 'www.')),
+                brand=brand_name(rng.randrange(BRAND_COUNT)),
+                tld=rng.choice(TLDS),
+            ))
+        with open(os.path.join(sites_dir, f"Category_{file_index:05d}.txt"), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+
+def generate_batch_lines(rng):
+    """Lines of a batch-add file: a mix of complete templates, bare URLs and junk, like real pastes."""
+    lines = []
+    for i in range(BATCH_FILE_LINES):
+        host = f"{brand_name(rng.randrange(BRAND_COUNT))}.{rng.choice(TLDS)}"
+        lines.append(rng.choice((
+            f"https://{host}/?s={{}}",
+            f"https://{host}/",
+            f"https://{host}/search?lang=en",
+            f"http://www.{host}/browse/{i}",
+            f"{host}/nothing-to-see",
+        )))
+    return lines
+
+
+def percentile(sorted_samples, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples, items_per_sample):
+    samples = sorted(samples)
+    total_seconds = sum(samples)
+    return {
+        'samples': len(samples),
+        'p50_ms': round(percentile(samples, 0.50) * 1000, 4),
+        'p95_ms': round(percentile(samples, 0.95) * 1000, 4),
+        'p99_ms': round(percentile(samples, 0.99) * 1000, 4),
+        'throughput_per_s': round(items_per_sample * len(samples) / total_seconds, 1) if total_seconds else None,
+    }
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def bench_tree(us, root, size_name, repeat, rng):
+    """Runs every operation against one synthetic tree. Returns {operation: summary}."""
+    file_count, urls_per_file = TREE_SIZES[size_name]
+    url_count = file_count * urls_per_file
+    sites_dir = os.path.join(root, f"SiteUrls_{size_name}")
+    generate_tree(sites_dir, file_count, urls_per_file, rng)
+    us.SITES_DATA_DIR = sites_dir
+
+    results = {}
+    quiet = contextlib.redirect_stdout(io.StringIO())
+
+    # Registry: cold loads start from empty caches, warm loads reuse them
+    cold, warm = [], []
+    with quiet:
+        for _ in range(repeat):
+            us.SITES_CACHE.clear()
+            us.BRAND_INDEX.clear()
+            elapsed, sites = timed(us.load_sites)
+            cold.append(elapsed)
+            warm.append(timed(us.load_sites)[0])
+    results['load_sites_cold'] = summarize(cold, url_count)
+    results['load_sites_warm'] = summarize(warm, url_count)
+
+    # The same loads from the single-file site database
+    us.SITES_DB_PATH = os.path.join(root, f"sites_{size_name}.db")
+    us.import_site_files_to_db()
+    us.CONFIG_CACHE['config'] = dict(us.DEFAULT_CONFIG, site_storage='sqlite')
+    db_cold, db_warm = [], []
+    with quiet:
+        for _ in range(repeat):
+            us.SITES_CACHE.clear()
+            us.BRAND_INDEX.clear()
+            db_cold.append(timed(us.load_sites)[0])
+            db_warm.append(timed(us.load_sites)[0])
+    us.CONFIG_CACHE['config'] = None
+    results['load_sites_db_cold'] = summarize(db_cold, url_count)
+    results['load_sites_db_warm'] = summarize(db_warm, url_count)
+
+    # URL updater matching, one lookup per sample
+    lookups = []
+    for _ in range(BRAND_LOOKUPS):
+        new_url = f"https://{brand_name(rng.randrange(BRAND_COUNT))}.{rng.choice(TLDS)}/"
+        parsed = urlparse(new_url)
+        start = time.perf_counter()
+        us.find_brand_matches(us.get_domain_base(new_url), f"{parsed.scheme}://{parsed.netloc}")
+        lookups.append(time.perf_counter() - start)
+    results['brand_match'] = summarize(lookups, 1)
+
+    # Batch-add processing, one whole file per sample
+    batch_lines = generate_batch_lines(rng)
+    batch = [timed(lambda: [us.normalize_batch_url(line) for line in batch_lines])[0] for _ in range(repeat)]
+    results['batch_add'] = summarize(batch, len(batch_lines))
+
+    # Rendering and launching one keyword across every category
+    categories = [sites[key] for key in sorted(sites)]
+    browser_data = ('Benchmark', {}, None)
+    render, launch = [], []
+    with quiet:
+        for i in range(repeat):
+            elapsed, plan = timed(us.build_launch_plan, categories, [f"benchmark keyword {i}"])
+            render.append(elapsed)
+            backend = us.RecordingBackend()
+            launch.append(timed(us.execute_launch_plan, plan, browser_data, False, 5, False, backend)[0])
+            if len(backend.urls) != url_count:
+                raise RuntimeError(f"launched {len(backend.urls)} of {url_count} URLs")
+    results['render'] = summarize(render, url_count)
+    results['launch'] = summarize(launch, url_count)
+
+    shutil.rmtree(sites_dir, ignore_errors=True)
+    os.remove(us.SITES_DB_PATH)
+    return results
+
+
+def print_results(results, baseline=None, threshold=0.10):
+    """Prints the result table (with p50 deltas against a baseline). Returns the regressed keys."""
+    regressions = []
+    header = f"{'size':<8}{'operation':<20}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}{'items/s':>14}"
+    if baseline:
+        header += f"{'p50 vs base':>14}"
+    print(header)
+    print('-' * len(header))
+    for key, stats in results.items():
+        size_name, operation = key.split('/', 1)
+        line = (f"{size_name:<8}{operation:<20}{stats['p50_ms']:>11.3f}{stats['p95_ms']:>11.3f}"
+                f"{stats['p99_ms']:>11.3f}{stats['throughput_per_s'] or 0:>14,.0f}")
+        if baseline:
+            old = baseline.get(key)
+            if old and old['p50_ms']:
+                change = stats['p50_ms'] / old['p50_ms'] - 1
+                flag = '  <-- slower' if change > threshold else ''
+                line += f"{change:>+13.1%}{flag}"
+                if flag:
+                    regressions.append(key)
+            else:
+                line += f"{'(new)':>14}"
+        print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the registry, rendering and launch pipeline of Ultimate Searcher.py.")
+    parser.add_argument('--sizes', default=','.join(DEFAULT_SIZES),
+                        help=f"comma-separated tree sizes from {', '.join(TREE_SIZES)} (default: {','.join(DEFAULT_SIZES)})")
+    parser.add_argument('--repeat', type=int, default=5, help="samples per load/render/launch measurement (default: 5)")
+    parser.add_argument('--seed', type=int, default=1234, help="seed for the synthetic trees (default: 1234)")
+    parser.add_argument('--save-baseline', metavar='PATH', help="write the results to a JSON baseline")
+    parser.add_argument('--compare', metavar='PATH', help="compare against a saved baseline")
+    parser.add_argument('--threshold', type=float, default=0.10, help="allowed p50 slowdown with --compare (default: 0.10)")
+    args = parser.parse_args()
+
+    sizes = [size.strip() for size in args.sizes.split(',') if size.strip()]
+    unknown = [size for size in sizes if size not in TREE_SIZES]
+    if unknown:
+        parser.error(f"unknown size(s): {', '.join(unknown)}")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+
+    root = tempfile.mkdtemp(prefix='searcher_bench_')
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            us = load_searcher(root)
+        rng = random.Random(args.seed)
+
+        results = {}
+        for size_name in sizes:
+            for operation, stats in bench_tree(us, root, size_name, args.repeat, rng).items():
+                results[f"{size_name}/{operation}"] = stats
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    print(f"Ultimate Searcher pipeline benchmark (Python {sys.version.split()[0]}, seed {args.seed}, repeat {args.repeat})\n")
+    regressions = print_results(results, baseline, args.threshold)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'python': sys.version.split()[0],
+                'seed': args.seed,
+                'repeat': args.repeat,
+                'results': results,
+            }, f, indent=2)
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    if regressions:
+        print(f"\n🚨 {len(regressions)} operation(s) slower than the baseline by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""
+Cold-start benchmark for Ultimate Searcher.py.
+
+Every run starts a fresh interpreter against a throwaway HOME (so your real site files,
+config and logs are never touched) and measures:
+
+  import      module import time, from `python -X importtime` (plus the slowest imports)
+  first menu  process launch -> main menu printed
+  first tab   process launch -> first batch of URLs handed to the browser (command-line mode)
+
+The browser is a stand-in shell script named 'firefox' that records when it is called.
+A copy of `sleep` with the same name is kept running so the script sees the browser as
+already open and skips its own warm-up wait, i.e. the numbers are the script's cost only.
+
+Usage:
+    python benchmarks/startup_bench.py [--runs 10] [--sites 50] [--json results.json]
+
+POSIX only (needs /bin/sh, `date +%s.%N` and `sleep`).
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Ultimate Searcher.py')
+MENU_MARKER = 'Welcome to your naughty launcher'
+CATEGORY_NAME = 'Bench Sites'
+TOP_IMPORTS = 10
+
+# Loads the script as a module without running its menu (the file name has a space in it)
+IMPORT_SNIPPET = (
+    "import importlib.util as u\n"
+    "s = u.spec_from_file_location('ultimate_searcher', {path!r})\n"
+    "s.loader.exec_module(u.module_from_spec(s))\n"
+)
+
+FAKE_BROWSER = """#!/bin/sh
+echo "$(date +%s.%N) $#" >> "{marker}"
+"""
+
+
+def make_sandbox(root, site_count):
+    """Creates a throwaway HOME with one category file, a saved config and the stand-in browser."""
+    home = os.path.join(root, 'home')
+    searcher_dir = os.path.join(home, 'Documents', 'UltimateSearcherFiles')
+    sites_dir = os.path.join(searcher_dir, 'SiteUrls')
+    os.makedirs(sites_dir)
+    os.makedirs(os.path.join(home, 'Downloads'))
+
+    with open(os.path.join(sites_dir, CATEGORY_NAME.replace(' ', '_') + '.txt'), 'w', encoding='utf-8') as f:
+        for i in range(site_count):
+            f.write(f"https://site{i}.example.com/search?q={{}}\n")
+    with open(os.path.join(searcher_dir, 'ultimate_searcher_config.txt'), 'w', encoding='utf-8') as f:
+        f.write("2\nFalse\n") # Firefox, logging off
+
+    browser_dir = os.path.join(root, 'browser')
+    os.makedirs(browser_dir)
+    marker_path = os.path.join(root, 'tabs.log')
+    browser_path = os.path.join(browser_dir, 'firefox')
+    with open(browser_path, 'w') as f:
+        f.write(FAKE_BROWSER.format(marker=marker_path))
+    os.chmod(browser_path, 0o755)
+
+    # An already-running "firefox" process, so the readiness check takes its fast path
+    holder_dir = os.path.join(root, 'running')
+    os.makedirs(holder_dir)
+    holder_path = os.path.join(holder_dir, 'firefox')
+    shutil.copy(shutil.which('sleep'), holder_path)
+    holder = subprocess.Popen([holder_path, '3600'])
+
+    env = dict(os.environ, HOME=home, PYTHONDONTWRITEBYTECODE='1')
+    return env, browser_path, marker_path, holder
+
+
+def measure_import(env):
+    """Returns (total_ms, [(cumulative_ms, module)]) for importing the script once."""
+    code = IMPORT_SNIPPET.format(path=SCRIPT_PATH)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    top_level = []
+    script_started = False # Everything before importlib.util is interpreter startup
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if not script_started:
+            script_started = name.strip() == 'importlib.util'
+            continue
+        if not name.startswith('  '): # Only modules imported directly, not their dependencies
+            top_level.append((int(cumulative) / 1000, name.strip()))
+    return sum(ms for ms, _ in top_level), sorted(top_level, reverse=True)[:TOP_IMPORTS]
+
+
+def measure_first_menu(env):
+    """Milliseconds from launching the interactive script until the main menu is printed."""
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, SCRIPT_PATH], env=env, stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding='utf-8')
+    elapsed = None
+    for line in proc.stdout:
+        if MENU_MARKER in line:
+            elapsed = (time.perf_counter() - start) * 1000
+            break
+    proc.communicate('0\n')
+    if elapsed is None:
+        raise RuntimeError("the main menu never appeared")
+    return elapsed
+
+
+def measure_first_tab(env, browser_path, marker_path):
+    """Milliseconds from launching a command-line search until the browser gets its first URLs."""
+    if os.path.exists(marker_path):
+        os.remove(marker_path)
+    start = time.time()
+    subprocess.run([sys.executable, SCRIPT_PATH, '-c', CATEGORY_NAME, '-k', 'benchmark',
+                    '--no-pause', '--browser-path', browser_path],
+                   env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    time.sleep(0.2) # The browser is started in the background; give the last call time to log
+    with open(marker_path) as f:
+        calls = [line.split() for line in f]
+    tab_calls = [float(stamp) for stamp, arg_count in calls if int(arg_count) > 0]
+    if not tab_calls:
+        raise RuntimeError("the browser was never given any URLs")
+    return (min(tab_calls) - start) * 1000
+
+
+def summarize(samples):
+    return {
+        'median_ms': round(statistics.median(samples), 1),
+        'min_ms': round(min(samples), 1),
+        'max_ms': round(max(samples), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start time of Ultimate Searcher.py.")
+    parser.add_argument('--runs', type=int, default=10, help="runs per measurement (default: 10)")
+    parser.add_argument('--sites', type=int, default=50, help="URLs in the benchmark category (default: 50)")
+    parser.add_argument('--json', metavar='PATH', help="also write the results to a JSON file")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix='searcher_startup_')
+    holder = None
+    try:
+        env, browser_path, marker_path, holder = make_sandbox(root, args.sites)
+
+        import_samples, menu_samples, tab_samples = [], [], []
+        slowest = []
+        for _ in range(args.runs):
+            total, slowest = measure_import(env)
+            import_samples.append(total)
+            menu_samples.append(measure_first_menu(env))
+            tab_samples.append(measure_first_tab(env, browser_path, marker_path))
+    finally:
+        if holder:
+            holder.kill()
+            holder.wait()
+        shutil.rmtree(root, ignore_errors=True)
+
+    results = {
+        'python': sys.version.split()[0],
+        'runs': args.runs,
+        'sites': args.sites,
+        'import': summarize(import_samples),
+        'first_menu': summarize(menu_samples),
+        'first_tab': summarize(tab_samples),
+        'slowest_imports_ms': {name: round(ms, 1) for ms, name in slowest},
+    }
+
+    print(f"Ultimate Searcher startup ({args.runs} runs, {args.sites} sites, Python {results['python']})")
+    for label, key in (('import', 'import'), ('first menu', 'first_menu'), ('first tab', 'first_tab')):
+        stats = results[key]
+        print(f"  {label:<11} median {stats['median_ms']:>7.1f} ms   min {stats['min_ms']:>7.1f} ms   max {stats['max_ms']:>7.1f} ms")
+    print("  slowest direct imports (last run):")
+    for name, ms in results['slowest_imports_ms'].items():
+        print(f"    {ms:>6.1f} ms  {name}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,49 +3,173 @@ import os
 import time
 import subprocess
 import urllib.parse  # For safe URL encoding
+import argparse
+import sys
 
 # Firefox path my sweet hacker 🦊
 firefox_path = "C:/Program Files/Mozilla Firefox/firefox.exe"
 
+# Where we peek to see if she's already awake 👀 (Linux only)
+proc_dir = "/proc"
+ready_timeout = 2.0
+ready_poll = 0.1
+
+# Adaptive pacing bounds 🎚️ as (min, start, max)
+pace_batch = (2, 5, 15)       # tabs per batch
+pace_delay = (0.1, 0.5, 2.0)  # seconds between tabs
+max_load_per_cpu = 1.0        # 1-minute load average per CPU core
+min_available_mb = 1024       # free memory we'd like to keep
+max_browser_rss_mb = 4096     # memory Firefox may take before we slow down
+
+# Who's already dancing with Firefox? 💃 (None if we can't peek on this OS)
+def find_browser_pids(browser_path):
+    if not os.path.isdir(proc_dir):
+        return None
+
+    real_path = os.path.realpath(browser_path)
+    names = {os.path.splitext(os.path.basename(p))[0] for p in (browser_path, real_path)}
+    install_dir = os.path.dirname(real_path) if real_path != browser_path else None
+    if install_dir and os.path.basename(install_dir) in ("bin", "sbin"):
+        install_dir = None
+
+    pids = []
+    for entry in os.listdir(proc_dir):
+        if not entry.isdigit() or int(entry) == os.getpid():
+            continue
+        try:
+            exe = os.readlink(os.path.join(proc_dir, entry, "exe"))
+        except OSError:
+            exe = ""
+        if not exe:
+            try:
+                with open(os.path.join(proc_dir, entry, "cmdline"), "rb") as f:
+                    exe = f.read().split(b"\0")[0].decode("utf-8", "replace")
+            except OSError:
+                continue
+        if os.path.basename(exe) in names or (install_dir and os.path.dirname(exe) == install_dir):
+            pids.append(int(entry))
+    return pids
+
+# Only wake her up if she's sleeping, then wait just long enough 😴➡️😈
+def ensure_browser_ready(browser_path):
+    running = find_browser_pids(browser_path)
+    if running:
+        print("\nFirefox is already awake and waiting for you, my sweet tech king 🦊💋")
+        return
+
+    print("\nWaking up Firefox for you, my sweet tech king 🦊💋")
+    subprocess.Popen([browser_path])
+    if running is None:
+        time.sleep(2)
+        return
+
+    deadline = time.monotonic() + ready_timeout
+    while time.monotonic() < deadline and len(find_browser_pids(browser_path)) < 2:
+        time.sleep(ready_poll)
+
+# How hard is the machine breathing right now? 😮‍💨 (above 1 means back off, None if we can't peek)
+def system_pressure(browser_path):
+    ratios = []
+    try:
+        with open(os.path.join(proc_dir, "loadavg")) as f:
+            ratios.append(float(f.read().split()[0]) / (os.cpu_count() or 1) / max_load_per_cpu)
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        with open(os.path.join(proc_dir, "meminfo")) as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    ratios.append(min_available_mb / max(int(line.split()[1]) / 1024, 1))
+                    break
+    except (OSError, ValueError, IndexError):
+        pass
+
+    pids = find_browser_pids(browser_path)
+    if pids is not None:
+        rss_kb = 0
+        for pid in pids:
+            try:
+                with open(os.path.join(proc_dir, str(pid), "status")) as f:
+                    rss_kb += next((int(line.split()[1]) for line in f if line.startswith("VmRSS:")), 0)
+            except (OSError, ValueError, IndexError):
+                continue
+        ratios.append(rss_kb / 1024 / max_browser_rss_mb)
+    return max(ratios) if ratios else None
+
+# Speed up when she's relaxed, slow down when she's sweating 🥵
+def next_pace(batch_size, delay, browser_path, fixed_batch=None):
+    pressure = system_pressure(browser_path)
+    if pressure is not None:
+        if pressure > 1.0:
+            batch_size = max(pace_batch[0], batch_size // 2)
+            delay = min(pace_delay[2], delay * 2)
+        elif pressure < 0.5:
+            batch_size = min(pace_batch[2], batch_size + 1)
+            delay = max(pace_delay[0], delay * 0.75)
+    return fixed_batch or batch_size, delay
+
+# What's on the menu tonight 🍽️
+category_names = {
+    1: "Cracked Software",
+    2: "Cracked Games",
+    3: "Movies (GDrive Links)",
+    4: "Movies (Direct Download)",
+    5: "Movies (Torrent Sites)",
+    6: "VFX / Design / Pro Softwares"
+}
+
 # Flirty little menu 😚
 def show_menu():
     print("\nWelcome to your naughty launcher, baby 😈💻")
     print("Choose what you’re craving today~ 💋")
-    print("1. Cracked Software")
-    print("2. Cracked Games")
-    print("3. Movies (GDrive Links)")
-    print("4. Movies (Direct Download)")
-    print("5. Movies (Torrent Sites)")
-    print("6. VFX / Design / Pro Softwares")
+    for number, name in category_names.items():
+        print(f"{number}. {name}")
     print("0. Exit 😢")
 
 # The hot tab opener 💦
-def run_search(sites, raw_keyword, special_handler=None):
+# With dry_run=True the URLs are just printed, Firefox stays asleep 👀
+def run_search(sites, raw_keyword, special_handler=None, batch_size=None, pause=True, dry_run=False):
     if not raw_keyword:
         print("You forgot to whisper your desire, darling 😳")
-        return
+        return False
 
     query = urllib.parse.quote_plus(raw_keyword)
     special_query = urllib.parse.quote(raw_keyword) if special_handler else query
 
-    if not os.path.exists(firefox_path):
-        print("Firefox isn’t there, baby 💔 Check her path again")
-        return
+    if dry_run:
+        open_tab = print
+    else:
+        if not os.path.exists(firefox_path):
+            print("Firefox isn’t there, baby 💔 Check her path again")
+            return False
 
-    print("\nWaking up Firefox for you, my sweet tech king 🦊💋")
-    subprocess.Popen(f'"{firefox_path}"')
-    time.sleep(2)
-    browser = webbrowser.get(f'"{firefox_path}" %s')
+        ensure_browser_ready(firefox_path)
+        open_tab = webbrowser.get(f'"{firefox_path}" %s').open_new_tab
 
-    for i in range(0, len(sites), 5):
-        for site in sites[i:i + 5]:
+    # Without a fixed batch_size the pace follows the system load
+    fixed_batch = batch_size
+    batch_size, delay = fixed_batch or pace_batch[1], pace_delay[1]
+    i = 0
+    while i < len(sites):
+        if not dry_run:
+            batch_size, delay = next_pace(batch_size, delay, firefox_path, fixed_batch)
+        batch = sites[i:i + batch_size]
+        i += len(batch)
+        for site in batch:
             search_term = special_query if special_handler and special_handler in site else query
-            browser.open_new_tab(site.format(search_term))
-            time.sleep(0.5)
-        if i + 5 < len(sites):
-            input("Press Enter to open more sinful tabs 😈")
+            open_tab(site.format(search_term))
+            if not dry_run:
+                time.sleep(delay)
+        if i < len(sites):
+            if pause and not dry_run: # Printed URLs don't need a breather
+                try:
+                    input("Press Enter to open more sinful tabs 😈")
+                except EOFError:
+                    print(f"\nNo more input, so I'm stopping here 💔 ({len(sites) - i} tabs left unopened)")
+                    break
         else:
             print("All done, my king 💻💋 Go enjoy your treasures~")
+    return True
 
 # Your naughty site list 💻🍓
 sites = {
@@ -168,8 +292,42 @@ sites = {
     ]
 }
 
+# Whisper your wishes from the command line, no menu needed 🤫
+def parse_args():
+    parser = argparse.ArgumentParser(description="Open a category's sites for one or more keywords. Run without options for the menu.")
+    parser.add_argument("-c", "--category", help="category number (1-6) or part of its name, e.g. 'torrent'")
+    parser.add_argument("-k", "--keyword", nargs="+", metavar="KEYWORD", help="one or more search keywords")
+    parser.add_argument("-b", "--batch-size", type=int, help="tabs opened per batch (default: adapts to system load, starting at 5)")
+    parser.add_argument("--no-pause", action="store_true", help="open all batches without waiting for Enter (always the case without a terminal)")
+    parser.add_argument("--dry-run", action="store_true", help="print the URLs instead of opening them")
+    args = parser.parse_args()
+    if (args.category is None) != (args.keyword is None):
+        parser.error("--category and --keyword must be used together")
+    if args.category is None and (args.batch_size is not None or args.no_pause or args.dry_run):
+        parser.error("search options need --category and --keyword (run without options for the menu)")
+    if args.batch_size is not None and args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    return args
+
+# Find the category you meant, cutie 🔎
+def find_category(category):
+    if category.isdigit() and int(category) in sites:
+        return int(category)
+    matches = [number for number, name in category_names.items() if category.lower() in name.lower()]
+    return matches[0] if len(matches) == 1 else None
+
 # Entry point, sugar 🍬
 if __name__ == "__main__":
+    args = parse_args()
+    if args.keyword:
+        choice = find_category(args.category)
+        if choice is None:
+            print(f"Which one did you mean by '{args.category}', baby? 😳 Try a number from 1 to 6.")
+            sys.exit(2)
+        special_handler = "1tamilmv" if choice == 3 else None
+        results = [run_search(sites[choice], keyword.strip(), special_handler, args.batch_size, not args.no_pause and sys.stdin.isatty(), args.dry_run) for keyword in args.keyword]
+        sys.exit(0 if all(results) else 1)
+
     while True:
         show_menu()
         try:
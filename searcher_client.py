@@ -0,0 +1,81 @@
+import socket
+import json
+import os
+import sys
+import time
+import argparse
+
+# Where the resident Ultimate Searcher (started with --daemon) listens for us 👂
+socket_path = os.path.join(os.path.expanduser('~'), 'Documents', 'UltimateSearcherFiles', 'searcher.sock')
+
+# Send one request, wait for one answer 💌
+def send_request(request, path, timeout=5.0):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(path)
+        client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        reply = b""
+        while not reply.endswith(b"\n"):
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            reply += chunk
+    return json.loads(reply.decode("utf-8"))
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Thin client for 'Ultimate Searcher.py --daemon': searches without the startup wait.")
+    parser.add_argument("-c", "--category", nargs="+", metavar="CATEGORY", help="one or more category names or site files")
+    parser.add_argument("-k", "--keyword", nargs="+", metavar="KEYWORD", help="one or more search keywords")
+    parser.add_argument("-b", "--batch-size", type=int, help="tabs opened per batch (default: the daemon's adaptive pacing)")
+    parser.add_argument("--dry-run", action="store_true", help="print the URLs instead of opening them")
+    parser.add_argument("--ping", action="store_true", help="check that the daemon is up")
+    parser.add_argument("--list", action="store_true", help="list the daemon's categories")
+    parser.add_argument("--stop", action="store_true", help="shut the daemon down")
+    parser.add_argument("--socket", default=socket_path, help=f"daemon socket (default: {socket_path})")
+    args = parser.parse_args()
+    if not (args.ping or args.list or args.stop) and not (args.category and args.keyword):
+        parser.error("give --category and --keyword, or one of --ping/--list/--stop")
+    return args
+
+# Whisper to the daemon, sugar 🍬
+if __name__ == "__main__":
+    if not hasattr(socket, "AF_UNIX"):
+        print("🚨 This system has no Unix domain sockets, so there's no daemon to talk to. Use 'Ultimate Searcher.py -c ... -k ...' instead.")
+        sys.exit(2)
+
+    args = parse_args()
+    if args.ping:
+        request = {"action": "ping"}
+    elif args.list:
+        request = {"action": "categories"}
+    elif args.stop:
+        request = {"action": "shutdown"}
+    else:
+        request = {"action": "search", "category": args.category, "keyword": args.keyword,
+                   "batch_size": args.batch_size, "dry_run": args.dry_run}
+
+    start = time.perf_counter()
+    try:
+        response = send_request(request, args.socket)
+    except (OSError, ValueError) as e:
+        print(f"💔 No daemon answering on {args.socket} ({e}). Start it with: python \"Ultimate Searcher.py\" --daemon")
+        sys.exit(3)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if not response.get("ok"):
+        print(f"🚨 {response.get('error', 'The daemon said no')}")
+        sys.exit(1)
+
+    if args.ping:
+        print(f"😈 Daemon (pid {response['pid']}) is awake and waiting ({elapsed_ms:.1f} ms)")
+    elif args.list:
+        for number, name in enumerate(response["categories"], start=1):
+            print(f"{number}. {name}")
+    elif args.stop:
+        print("Okay baby 💔 Daemon is going to sleep.")
+    elif args.dry_run:
+        for url in response["urls"]:
+            print(url)
+    else:
+        skipped = f", {response['duplicates']} duplicate(s) skipped" if response.get("duplicates") else ""
+        print(f"💋 {response['tabs']} tabs on their way{skipped} ({elapsed_ms:.1f} ms)")